@@ -122,9 +122,11 @@ class VectorizedSMCEngine:
         """
         start_time = time.perf_counter()
         
-        # 数据准备
+        # 数据准备（强制 C 连续行主序，保证逐 bar 访问的缓存局部性）
         self._df = self._prepare_dataframe(df)
-        self._ohlcv = self._df[['open', 'high', 'low', 'close', 'volume']].values
+        self._ohlcv = np.ascontiguousarray(
+            self._df[['open', 'high', 'low', 'close', 'volume']].values
+        )
         
         output = AnalysisOutput(
             symbol=symbol,
@@ -24,10 +24,32 @@ import numpy as np
 import pandas as pd
 
 from ..smc_analysis import SMCAnalyzer, AnalysisResult, OrderBlock, FairValueGap
+from ..utils._njit import njit
 
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True)
+def _atr_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """Mean true range of the trailing `period` bars (plain-array kernel)."""
+    n = high.shape[0]
+    start = n - period
+    if start < 1:
+        start = 1
+    total = 0.0
+    count = 0
+    for i in range(start, n):
+        tr = high[i] - low[i]
+        diff = abs(high[i] - close[i - 1])
+        if diff > tr:
+            tr = diff
+        total += tr
+        count += 1
+    if count == 0:
+        return 0.0
+    return total / count
+
+
 @dataclass
 class EnhancedTradingSignal:
     """Enhanced trading signal with comprehensive analysis."""
@@ -285,9 +307,49 @@ class EnhancedSMCStrategy:
         analysis.estimated_win_rate = self._estimate_win_rate(analysis)
         analysis.estimated_rr = analysis.primary_signal.risk_reward_ratio if analysis.primary_signal else 0
         analysis.max_drawdown_risk = self._estimate_drawdown_risk(analysis)
-        
+
         return analysis
-    
+
+    def begin_scan(self, seed_df: pd.DataFrame, window_size: int = 450) -> None:
+        """
+        Seed the rolling-window state for incremental scanning.
+
+        Args:
+            seed_df: Initial bars (oldest history)
+            window_size: Maximum bars kept in the rolling window
+        """
+        self._scan_window = window_size
+        self._scan_buffer = seed_df.tail(window_size).reset_index(drop=True)
+
+    def analyze_step(
+        self,
+        new_bars: pd.DataFrame,
+        symbol: str = "UNKNOWN",
+        name: str = "",
+    ) -> EnhancedStrategyAnalysis:
+        """
+        Advance the rolling window by `new_bars` and re-analyze.
+
+        The window maintenance is O(new bars): old bars fall off the front
+        and only the fixed-size window is re-analyzed, so per-step cost is
+        bounded by the window instead of growing with total history. The
+        SMC structure kernels themselves (swings/OBs/FVGs) come from the
+        batch-only smart-money-concepts package and are recomputed over
+        the window.
+
+        Args:
+            new_bars: Bars appended since the previous step
+            symbol: Stock symbol
+            name: Stock name
+
+        Returns:
+            EnhancedStrategyAnalysis for the current window
+        """
+        self._scan_buffer = pd.concat(
+            [self._scan_buffer, new_bars], ignore_index=True
+        ).tail(self._scan_window).reset_index(drop=True)
+        return self.analyze(self._scan_buffer, symbol=symbol, name=name)
+
     def _calculate_ob_statistics(
         self,
         analysis: EnhancedStrategyAnalysis,
@@ -351,28 +413,22 @@ class EnhancedSMCStrategy:
         """Detect current market regime."""
         if len(df) < 50:
             return "unknown"
-        
-        # Calculate ADX-like indicator
-        recent_df = df.tail(50)
-        
-        high = recent_df['high']
-        low = recent_df['low']
-        close = recent_df['close']
-        
-        # True Range
-        tr = np.maximum(high - low, np.abs(high - close.shift(1)))
-        tr = tr.dropna()
-        
-        # Average True Range
-        atr = tr.rolling(14).mean().iloc[-1]
-        
+
+        # ADX-like indicator on raw arrays via the jitted ATR kernel
+        # (mean of the trailing 14 true ranges)
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+
+        atr = _atr_kernel(high, low, close, 14)
+
         # Price change
-        price_change = (close.iloc[-1] - close.iloc[-20]) / close.iloc[-20]
+        price_change = (close[-1] - close[-20]) / close[-20]
         
         # Regime detection
         if abs(price_change) > 0.1:  # 10% move in 20 periods
             return "trending"
-        elif atr / close.iloc[-1] > 0.03:  # High volatility
+        elif atr / close[-1] > 0.03:  # High volatility
             return "choppy"
         else:
             return "ranging"
@@ -381,24 +437,25 @@ class EnhancedSMCStrategy:
         """Calculate current volatility (ATR-based)."""
         if len(df) < 14:
             return 0.0
-        
-        recent = df.tail(14)
-        tr = np.maximum(
-            recent['high'] - recent['low'],
-            np.abs(recent['high'] - recent['close'].shift(1))
-        )
-        atr = tr.mean()
-        
-        return (atr / recent['close'].iloc[-1]) * 100  # As percentage
+
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
+
+        # 13 true ranges over the 14-bar tail (the first bar only seeds
+        # the previous close), matching the old shift/NaN-skipping mean
+        atr = _atr_kernel(high, low, close, 13)
+
+        return (atr / close[-1]) * 100  # As percentage
     
     def _calculate_momentum(self, df: pd.DataFrame) -> float:
         """Calculate price momentum."""
         if len(df) < 10:
             return 0.0
-        
-        close = df['close']
-        momentum = (close.iloc[-1] - close.iloc[-10]) / close.iloc[-10] * 100
-        
+
+        close = df['close'].to_numpy(dtype=np.float64)
+        momentum = (close[-1] - close[-10]) / close[-10] * 100
+
         return momentum
     
     def _generate_enhanced_signal(
@@ -0,0 +1,27 @@
+"""
+SMC Analysis - Optional numba acceleration
+==========================================
+
+numba is an optional dependency. When it is installed, ``njit``/``prange``
+are the real thing; otherwise they degrade to no-ops so decorated kernels
+still run as plain Python. Callers that should only take the compiled
+path can guard on ``NUMBA_AVAILABLE``.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+    prange = range
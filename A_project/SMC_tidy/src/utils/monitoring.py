@@ -177,6 +177,45 @@ class PerformanceMonitor:
             if len(self._operations[operation]) > self.max_history:
                 self._operations[operation] = self._operations[operation][-self.max_history:]
     
+    def record_many(
+        self,
+        operation: str,
+        durations_ms,
+        success: bool = True,
+        tags: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Bulk-record a batch of pre-measured operation durations.
+
+        Builds all records and takes the lock once, instead of paying the
+        per-call timer/memory-probe cost of track() for each entry.
+
+        Args:
+            operation: Operation name
+            durations_ms: Iterable of durations in milliseconds
+            success: Whether the operations succeeded
+            tags: Optional tags applied to every record
+        """
+        timestamp = datetime.now().isoformat()
+        tags = tags or {}
+        records = [
+            {
+                "timestamp": timestamp,
+                "duration_ms": float(d),
+                "memory_delta_mb": 0.0,
+                "success": success,
+                "error": None,
+                "tags": tags,
+            }
+            for d in durations_ms
+        ]
+
+        with self._lock:
+            ops = self._operations[operation]
+            ops.extend(records)
+            if len(ops) > self.max_history:
+                self._operations[operation] = ops[-self.max_history:]
+
     def record_metric(
         self,
         name: str,
@@ -15,10 +15,69 @@ import numpy as np
 import pandas as pd
 
 from .exceptions import DataValidationError, ConfigurationError
+from ._njit import njit, prange, NUMBA_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, parallel=True)
+def _ohlcv_stats(arr: np.ndarray) -> Tuple:
+    """Single-pass quality stats over an (n, 4) open/high/low/close array.
+
+    Returns per-column (nan_counts, neg_counts, means, stds, extreme_counts)
+    plus the OHLC consistency violation counts (high_viol, low_viol).
+    Compiled with numba when available; see NUMBA_AVAILABLE.
+    """
+    n_rows, n_cols = arr.shape
+    nan_counts = np.zeros(n_cols, dtype=np.int64)
+    neg_counts = np.zeros(n_cols, dtype=np.int64)
+    sums = np.zeros(n_cols)
+    sumsqs = np.zeros(n_cols)
+    for j in prange(n_cols):
+        for i in range(n_rows):
+            v = arr[i, j]
+            if np.isnan(v):
+                nan_counts[j] += 1
+            else:
+                if v < 0:
+                    neg_counts[j] += 1
+                sums[j] += v
+                sumsqs[j] += v * v
+
+    means = np.zeros(n_cols)
+    stds = np.zeros(n_cols)
+    for j in range(n_cols):
+        m = n_rows - nan_counts[j]
+        if m > 1:
+            means[j] = sums[j] / m
+            var = (sumsqs[j] - m * means[j] * means[j]) / (m - 1)
+            if var > 0:
+                stds[j] = np.sqrt(var)
+
+    extreme_counts = np.zeros(n_cols, dtype=np.int64)
+    for j in prange(n_cols):
+        if stds[j] > 0:
+            threshold = 5.0 * stds[j]
+            for i in range(n_rows):
+                v = arr[i, j]
+                if not np.isnan(v) and abs(v - means[j]) > threshold:
+                    extreme_counts[j] += 1
+
+    # OHLC consistency: high >= max(open, close), low <= min(open, close)
+    high_viol = 0
+    low_viol = 0
+    for i in range(n_rows):
+        o = arr[i, 0]
+        c = arr[i, 3]
+        mx = o if o > c else c
+        mn = o if o < c else c
+        if arr[i, 1] < mx:
+            high_viol += 1
+        if arr[i, 2] > mn:
+            low_viol += 1
+    return nan_counts, neg_counts, means, stds, extreme_counts, high_viol, low_viol
+
+
 # Required columns for different data types
 REQUIRED_COLUMNS = {
     "stock_ohlcv": ["open", "high", "low", "close", "volume"],
@@ -122,23 +181,26 @@ class DataValidator:
             result.add_error(f"DataFrame is empty for {symbol}")
             return result
         
-        # Check required columns
+        # Check required columns against a lowercase map built once,
+        # instead of re-scanning df.columns per required column
         required_cols = REQUIRED_COLUMNS.get(data_type, REQUIRED_COLUMNS["stock_ohlcv"])
-        missing_cols = [col for col in required_cols if col.lower() not in [c.lower() for c in df.columns]]
-        
-        if missing_cols:
-            # Try to find similar column names
-            for missing in missing_cols:
-                found = False
-                for col in df.columns:
-                    if missing.lower() in col.lower() or col.lower() in missing.lower():
-                        if self.auto_fix:
-                            df.rename(columns={col: missing}, inplace=True)
-                            logger.log(self.log_level, f"Renamed column '{col}' to '{missing}' for {symbol}")
-                            found = True
-                            break
-                if not found:
-                    result.add_error(f"Missing required column '{missing}' for {symbol}")
+        norm = {c.lower().strip(): c for c in df.columns}
+        missing_cols = [col for col in required_cols if col.lower() not in norm]
+
+        for missing in missing_cols:
+            target = missing.lower()
+            # Try exact normalized lookup first, then one substring pass
+            candidate = norm.get(target)
+            if candidate is None:
+                candidate = next(
+                    (orig for low, orig in norm.items() if target in low or low in target),
+                    None,
+                )
+            if candidate is not None and self.auto_fix:
+                df.rename(columns={candidate: missing}, inplace=True)
+                logger.log(self.log_level, f"Renamed column '{candidate}' to '{missing}' for {symbol}")
+            else:
+                result.add_error(f"Missing required column '{missing}' for {symbol}")
         
         # Check minimum data points
         min_points = MIN_DATA_POINTS.get(timeframe, 100)
@@ -170,46 +232,75 @@ class DataValidator:
         """Validate OHLCV data quality."""
         # Normalize column names
         df_cols = {col.lower(): col for col in df.columns}
-        
-        for col in ["open", "high", "low", "close"]:
-            if col not in df_cols:
-                continue
-            series = df[df_cols[col]]
-            
-            # Check for NaN values
-            nan_count = series.isna().sum()
+        ohlc = ["open", "high", "low", "close"]
+        present = [c for c in ohlc if c in df_cols]
+
+        # col -> (size, nan_count, neg_count, extreme_count)
+        stats: Dict[str, Tuple[int, int, int, int]] = {}
+        consistency = None
+
+        if NUMBA_AVAILABLE and len(present) == 4:
+            # One compiled pass over a contiguous (n, 4) array produces every
+            # per-column statistic plus the OHLC consistency counters
+            arr = np.ascontiguousarray(
+                df[[df_cols[c] for c in ohlc]].to_numpy(dtype=np.float64)
+            )
+            nan_counts, neg_counts, _, _, extreme_counts, high_viol, low_viol = _ohlcv_stats(arr)
+            for j, col in enumerate(ohlc):
+                stats[col] = (
+                    arr.shape[0],
+                    int(nan_counts[j]),
+                    int(neg_counts[j]),
+                    int(extreme_counts[j]),
+                )
+            consistency = (int(high_viol), int(low_viol))
+        else:
+            for col in present:
+                # Pull the raw ndarray once; all stats below derive from one
+                # sum/sumsq sweep instead of separate pandas scans per check
+                vals = df[df_cols[col]].to_numpy(dtype=np.float64, copy=False)
+                nan_count = int(np.isnan(vals).sum())
+                # NaN compares False, so the negative count needs no mask
+                neg_count = int((vals < 0).sum())
+                # mean/std derived from sum and sum-of-squares, ddof=1 as before
+                extreme_count = 0
+                n = vals.size - nan_count
+                if n > 1:
+                    total = float(np.nansum(vals))
+                    sumsq = float(np.nansum(vals * vals))
+                    mean_val = total / n
+                    var = (sumsq - n * mean_val * mean_val) / (n - 1)
+                    std_val = np.sqrt(var) if var > 0 else 0.0
+                    if std_val > 0:
+                        # count_nonzero avoids reducing through an intermediate
+                        # int cast; the numba path avoids the bool buffer entirely
+                        extreme_count = int(np.count_nonzero(np.abs(vals - mean_val) > 5 * std_val))
+                stats[col] = (vals.size, nan_count, neg_count, extreme_count)
+
+            # Check OHLC consistency: high >= max(open, close), low <= min(open, close)
+            if len(present) == 4:
+                high_viol = int((df[df_cols["high"]] < df[[df_cols["open"], df_cols["close"]]].max(axis=1)).sum())
+                low_viol = int((df[df_cols["low"]] > df[[df_cols["open"], df_cols["close"]]].min(axis=1)).sum())
+                consistency = (high_viol, low_viol)
+
+        for col, (size, nan_count, neg_count, extreme_count) in stats.items():
             if nan_count > 0:
-                nan_pct = nan_count / len(series) * 100
+                nan_pct = nan_count / size * 100
                 if nan_pct > 5:
                     result.add_error(f"Too many NaN values in {col} for {symbol}: {nan_pct:.1f}%")
                 else:
                     result.add_warning(f"NaN values in {col} for {symbol}: {nan_count}")
-            
-            # Check for negative values (except volume can be 0)
-            if col != "volume":
-                neg_count = (series < 0).sum()
-                if neg_count > 0:
-                    result.add_error(f"Negative values in {col} for {symbol}: {neg_count}")
-            
-            # Check for extreme values (potential data errors)
-            if col in ["open", "high", "low", "close"]:
-                mean_val = series.mean()
-                std_val = series.std()
-                if std_val > 0:
-                    z_scores = np.abs((series - mean_val) / std_val)
-                    extreme_count = (z_scores > 5).sum()
-                    if extreme_count > 0:
-                        result.add_warning(f"Extreme values in {col} for {symbol}: {extreme_count}")
-        
-        # Check OHLC consistency: high >= max(open, close), low <= min(open, close)
-        if all(c in df_cols for c in ["open", "high", "low", "close"]):
-            high_violations = (df[df_cols["high"]] < df[[df_cols["open"], df_cols["close"]]].max(axis=1)).sum()
-            low_violations = (df[df_cols["low"]] > df[[df_cols["open"], df_cols["close"]]].min(axis=1)).sum()
-            
-            if high_violations > 0:
-                result.add_warning(f"High < max(open,close) in {high_violations} rows for {symbol}")
-            if low_violations > 0:
-                result.add_warning(f"Low > min(open,close) in {low_violations} rows for {symbol}")
+            if neg_count > 0:
+                result.add_error(f"Negative values in {col} for {symbol}: {neg_count}")
+            if extreme_count > 0:
+                result.add_warning(f"Extreme values in {col} for {symbol}: {extreme_count}")
+
+        if consistency is not None:
+            high_viol, low_viol = consistency
+            if high_viol > 0:
+                result.add_warning(f"High < max(open,close) in {high_viol} rows for {symbol}")
+            if low_viol > 0:
+                result.add_warning(f"Low > min(open,close) in {low_viol} rows for {symbol}")
     
     def _check_data_freshness(
         self,
@@ -281,9 +372,11 @@ class DataValidator:
                 expected_gap = timedelta(days=7)
                 max_gap = timedelta(days=14)
             
-            # Count significant gaps
-            gaps = dates.diff()
-            large_gaps = (gaps > max_gap).sum()
+            # Count significant gaps via int64 nanosecond diffs instead of
+            # materializing a Timedelta series and comparing to a timedelta
+            ns = dates.to_numpy(dtype="datetime64[ns]").view("int64")
+            max_gap_ns = int(max_gap.total_seconds() * 1e9)
+            large_gaps = int((np.diff(ns) > max_gap_ns).sum())
             
             if large_gaps > 0:
                 result.add_warning(f"Found {large_gaps} significant data gaps for {symbol}")
@@ -343,20 +436,14 @@ def validate_stock_data(
         Tuple of (is_valid, cleaned_df, issues)
     """
     issues = []
-    
+
     if df is None or df.empty:
         return False, df, ["DataFrame is empty"]
-    
-    # Make a copy to avoid modifying original
-    df = df.copy()
-    
+
     # Set minimum rows
     if min_rows is None:
         min_rows = MIN_DATA_POINTS.get(timeframe, 100)
-    
-    # Clean column names
-    df.columns = [c.lower().strip() for c in df.columns]
-    
+
     # Handle common column name variations
     column_mapping = {
         "日期": "date",
@@ -370,42 +457,65 @@ def validate_stock_data(
         "振幅": "amplitude",
         "换手率": "turnover",
     }
-    
-    for old_name, new_name in column_mapping.items():
-        if old_name in df.columns and new_name not in df.columns:
-            df.rename(columns={old_name: new_name}, inplace=True)
-    
+
+    # Normalize column names in one rename (no data copy, caller untouched)
+    lowered = {c: str(c).lower().strip() for c in df.columns}
+    present = set(lowered.values())
+    rename = {}
+    for orig, low in lowered.items():
+        mapped = column_mapping.get(low)
+        if mapped is not None and mapped not in present:
+            rename[orig] = mapped
+            present.add(mapped)
+        else:
+            rename[orig] = low
+    df = df.rename(columns=rename)
+
     # Check required columns
     required = ["open", "high", "low", "close", "volume"]
     missing = [c for c in required if c not in df.columns]
-    
+
     if missing:
         issues.append(f"Missing columns: {missing}")
         return False, df, issues
-    
-    # Remove rows with NaN in critical columns
-    initial_len = len(df)
-    df = df.dropna(subset=required)
-    if len(df) < initial_len:
-        issues.append(f"Removed {initial_len - len(df)} rows with NaN values")
-    
-    # Remove rows with negative prices
+
+    # Drop NaN rows and non-positive prices with one combined mask,
+    # applied as a single copy instead of chained filtered copies
     price_cols = ["open", "high", "low", "close"]
-    initial_len = len(df)
+    notna_mask = np.ones(len(df), dtype=bool)
+    for col in required:
+        notna_mask &= df[col].notna().to_numpy()
+    keep_mask = notna_mask.copy()
     for col in price_cols:
-        df = df[df[col] > 0]
-    if len(df) < initial_len:
-        issues.append(f"Removed {initial_len - len(df)} rows with invalid prices")
-    
-    # Fix OHLC consistency if needed
-    df["high"] = df[["high", "open", "close"]].max(axis=1)
-    df["low"] = df[["low", "open", "close"]].min(axis=1)
+        keep_mask &= df[col].to_numpy() > 0
+
+    nan_removed = int(len(df) - notna_mask.sum())
+    price_removed = int(notna_mask.sum() - keep_mask.sum())
+    if nan_removed:
+        issues.append(f"Removed {nan_removed} rows with NaN values")
+    if price_removed:
+        issues.append(f"Removed {price_removed} rows with invalid prices")
+
+    df = df.loc[keep_mask].copy()
+
+    # Fix OHLC consistency if needed (ufunc reduce over raw arrays,
+    # no row-wise DataFrame reduction)
+    open_vals = df["open"].to_numpy()
+    close_vals = df["close"].to_numpy()
+    df["high"] = np.maximum.reduce([df["high"].to_numpy(), open_vals, close_vals])
+    df["low"] = np.minimum.reduce([df["low"].to_numpy(), open_vals, close_vals])
     
     # Check minimum rows
     if len(df) < min_rows:
         issues.append(f"Insufficient data: {len(df)} rows (need {min_rows})")
         return False, df, issues
-    
+
+    # Downcast to the smallest sufficient dtypes so downstream vectorized
+    # passes touch half the memory
+    for col in price_cols:
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    df["volume"] = pd.to_numeric(df["volume"], downcast="unsigned")
+
     return True, df, issues
 
 
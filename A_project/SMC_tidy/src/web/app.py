@@ -6,6 +6,7 @@ SMC Web Application - 买入信号 Top 20
 从最新 smc_report Excel 中读取信号强度前20的买入信号，
 展示对应的 SMC 分析图表。
 """
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Optional, Dict
@@ -33,6 +34,19 @@ GRAY = "#8b949e"
 TOP_N = 20
 
 
+def _build_chart_index(charts_dir: Path) -> tuple:
+    """扫描 charts 目录一次，返回 (代码前缀索引, 文件名集合)（避免逐信号 glob/stat）."""
+    index: Dict[str, Path] = {}
+    names: set = set()
+    if not charts_dir.is_dir():
+        return index, names
+    for p in charts_dir.iterdir():
+        if p.name.endswith("_chart.html"):
+            names.add(p.name)
+            index.setdefault(p.name.split("_", 1)[0], p)
+    return index, names
+
+
 def _load_top_signals(reports_dir: Path, charts_dir: Path) -> List[Dict]:
     """从最新 smc_report Excel 读取信号强度前20的买入信号."""
     report_files = sorted(
@@ -49,17 +63,30 @@ def _load_top_signals(reports_dir: Path, charts_dir: Path) -> List[Dict]:
         logger.error(f"读取报告失败: {e}")
         return []
 
+    # 数值列降级为 float32，减小后续逐行访问的缓冲区
+    # （代码列除外：Excel 可能按数字存储，转 float 会破坏补零逻辑）
+    for c in df.select_dtypes(include="number").columns:
+        if c != "代码":
+            df[c] = pd.to_numeric(df[c], downcast="float")
+
+    # 重复字符串列转 category，== 比较走整数码而非逐元素字符串比较
+    for c in ("信号类型", "代码", "名称"):
+        if c in df.columns and df[c].dtype == object:
+            df[c] = df[c].astype("category")
+
     # 仅保留 long 信号，按信号强度降序取前 TOP_N
     df = df[df["信号类型"] == "long"].copy()
     df = df.sort_values("信号强度", ascending=False).head(TOP_N)
 
+    chart_index, chart_names = _build_chart_index(charts_dir)
+
     results = []
     for _, row in df.iterrows():
         code = str(row["代码"]).zfill(6) if str(row["代码"]).isdigit() and len(str(row["代码"])) <= 6 else str(row["代码"])
         name = str(row["名称"])
 
         # 匹配图表文件
-        chart_file = _find_chart(charts_dir, code, name)
+        chart_file = _find_chart(charts_dir, chart_index, chart_names, code, name)
 
         results.append({
             "code": code,
@@ -80,21 +107,52 @@ def _load_top_signals(reports_dir: Path, charts_dir: Path) -> List[Dict]:
     return results
 
 
-def _find_chart(charts_dir: Path, code: str, name: str) -> Optional[Path]:
-    """在 charts 目录中查找匹配的图表文件."""
+def _find_chart(
+    charts_dir: Path,
+    chart_index: Dict[str, Path],
+    chart_names: set,
+    code: str,
+    name: str,
+) -> Optional[Path]:
+    """在 charts 目录中查找匹配的图表文件（纯内存查找，无 stat/glob 系统调用）."""
     raw = code.lstrip("0") or "0"
     # 尝试多种代码格式: 原始、6位补零、5位补零、去零
     code_variants = list(dict.fromkeys([code, raw.zfill(6), raw.zfill(5), raw]))
     for c in code_variants:
-        exact = charts_dir / f"{c}_{name}_chart.html"
-        if exact.exists():
-            return exact
+        fname = f"{c}_{name}_chart.html"
+        if fname in chart_names:
+            return charts_dir / fname
+    # 前缀索引 O(1) 查找，代替逐前缀 glob 扫描；过短的前缀容易误匹配，跳过
     for c in code_variants:
-        for f in charts_dir.glob(f"{c}_*_chart.html"):
-            return f
+        if len(c) < 4:
+            continue
+        hit = chart_index.get(c)
+        if hit is not None:
+            return hit
     return None
 
 
+def _page_cache_key(reports_dir: Path, charts_dir: Path) -> tuple:
+    """页面内容只依赖最新报告和 charts 目录，用两者 mtime 作缓存键."""
+    report_mtime = 0
+    charts_mtime = 0
+    try:
+        latest = max(
+            reports_dir.glob("smc_report_*.xlsx"),
+            key=lambda f: f.stat().st_mtime_ns,
+            default=None,
+        )
+        if latest is not None:
+            report_mtime = latest.stat().st_mtime_ns
+    except OSError:
+        pass
+    try:
+        charts_mtime = charts_dir.stat().st_mtime_ns
+    except OSError:
+        pass
+    return (report_mtime, charts_mtime)
+
+
 def _render_page(title: str, body: str) -> str:
     return f'''<!DOCTYPE html>
 <html lang="zh-CN">
@@ -185,9 +243,20 @@ def setup_app() -> FastAPI:
     if reports_dir.exists():
         app.mount("/static/reports", StaticFiles(directory=str(reports_dir)), name="reports_static")
 
+    # 渲染结果按 (报告 mtime, charts 目录 mtime) 缓存，报告重生成后自动失效
+    page_cache: Dict[tuple, str] = {}
+    page_cache_max = 4
+
     @app.get("/", response_class=HTMLResponse)
     async def index():
-        signals = _load_top_signals(reports_dir, charts_dir)
+        cache_key = _page_cache_key(reports_dir, charts_dir)
+        cached = page_cache.pop(cache_key, None)
+        if cached is not None:
+            page_cache[cache_key] = cached  # 命中移到队尾 (LRU)
+            return cached
+
+        # Excel 读取是阻塞 IO，放到线程池避免卡住事件循环
+        signals = await asyncio.to_thread(_load_top_signals, reports_dir, charts_dir)
 
         with_chart = sum(1 for s in signals if s["chart_filename"])
         avg_str = sum(s["strength"] for s in signals) / len(signals) if signals else 0
@@ -199,7 +268,8 @@ def setup_app() -> FastAPI:
             <div class="stat-box"><div class="val" style="color:{YELLOW}">{avg_str:.0f}</div><div class="lbl">平均强度</div></div>
         </div>'''
 
-        cards_html = ""
+        # 列表收集 + join，避免 O(n²) 的字符串 += 重建
+        card_parts = []
         for i, s in enumerate(signals):
             rank_cls = "rank top3" if i < 3 else "rank"
             str_cls = "high" if s["strength"] >= 70 else "mid"
@@ -211,7 +281,7 @@ def setup_app() -> FastAPI:
             else:
                 chart_inner = '<div class="no-chart">暂无图表</div>'
 
-            cards_html += f'''
+            card_parts.append(f'''
 <div class="signal-card">
     <div class="signal-head" onclick="toggle('{chart_id}')">
         <div class="left">
@@ -233,8 +303,9 @@ def setup_app() -> FastAPI:
     <div id="{chart_id}" class="chart-frame">
         {chart_inner}
     </div>
-</div>'''
+</div>''')
 
+        cards_html = "".join(card_parts)
         body = f'''<div class="header">
     <h1>SMC 买入信号 Top {TOP_N}</h1>
     <span class="sub">数据来源: {report_name}</span>
@@ -245,7 +316,11 @@ def setup_app() -> FastAPI:
         {cards_html if cards_html else '<div class="empty">暂无买入信号，请先运行 one_click_v2.py</div>'}
     </div>
 </div>'''
-        return _render_page(f"SMC 买入信号 Top {TOP_N}", body)
+        page = _render_page(f"SMC 买入信号 Top {TOP_N}", body)
+        page_cache[cache_key] = page
+        if len(page_cache) > page_cache_max:
+            page_cache.pop(next(iter(page_cache)))
+        return page
 
     @app.get("/chart/{filename}", response_class=HTMLResponse)
     async def view_chart(filename: str):
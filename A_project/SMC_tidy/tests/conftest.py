@@ -0,0 +1,21 @@
+"""
+Shared pytest configuration for the SMC test suite.
+"""
+import sys
+from pathlib import Path
+
+# Make `src` importable once per worker instead of per test module
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Pay the heavy imports once at collection time (once per xdist worker)
+# instead of inside the first test that touches them
+import plotly.graph_objects as _go  # noqa: F401
+import src.core  # noqa: F401
+import src.orchestrator  # noqa: F401
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "perf: wall-clock performance benchmarks (deselect with -m 'not perf')",
+    )
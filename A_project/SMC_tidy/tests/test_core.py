@@ -8,11 +8,14 @@ import pytest
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from unittest.mock import Mock
+import os
 import sys
+import uuid
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# src is put on sys.path by tests/conftest.py
 
 from src.core import (
     VectorizedSMCEngine,
@@ -31,51 +34,92 @@ from src.core import (
 from src.orchestrator import SMCOrchestrator, OrchestratorConfig, analyze_from_file
 
 
-def create_sample_ohlcv(n_bars: int = 300, seed: int = 42) -> pd.DataFrame:
-    """Create sample OHLCV data for testing."""
-    np.random.seed(seed)
-    
-    dates = pd.date_range(start='2024-01-01', periods=n_bars, freq='D')
-    
-    # Create realistic price pattern
+# One shared DatetimeIndex; fixtures slice views from it instead of
+# allocating and validating a fresh index per call
+_DATE_CACHE = pd.date_range(start='2024-01-01', periods=20000, freq='D')
+
+
+@lru_cache(maxsize=8)
+def _build_ohlcv_cached(n_bars: int, seed: int) -> pd.DataFrame:
+    """Build sample OHLCV data once per (n_bars, seed); treat as immutable."""
+    rng = np.random.default_rng(seed)
+
+    if n_bars <= len(_DATE_CACHE):
+        dates = _DATE_CACHE[:n_bars]
+    else:
+        dates = pd.date_range(start='2024-01-01', periods=n_bars, freq='D')
+
+    # Create realistic price pattern (up then down) as one vectorized
+    # random walk instead of a Python append loop
     base_price = 100
-    prices = [base_price]
-    
-    for i in range(n_bars - 1):
-        trend = 0.1 if i < n_bars // 2 else -0.05  # Up then down
-        noise = np.random.uniform(-1, 1)
-        prices.append(prices[-1] + trend + noise)
-    
-    prices = np.array(prices)
-    
-    # Create OHLCV
-    df = pd.DataFrame({
-        'date': dates,
-        'open': prices,
-        'high': prices + np.random.uniform(0.5, 2, n_bars),
-        'low': prices - np.random.uniform(0.5, 2, n_bars),
-        'close': prices + np.random.uniform(-0.5, 0.5, n_bars),
-        'volume': np.random.randint(1000000, 10000000, n_bars),
-    })
-    
-    # Ensure OHLC consistency
-    df['high'] = df[['high', 'open', 'close']].max(axis=1)
-    df['low'] = df[['low', 'open', 'close']].min(axis=1)
-    
+    trend = np.where(np.arange(n_bars) < n_bars // 2, 0.1, -0.05)
+    steps = trend + rng.uniform(-1, 1, n_bars)
+    steps[0] = 0
+    prices = base_price + np.cumsum(steps)
+
+    # Create OHLCV; enforce consistency on raw arrays (ufunc reduce) before
+    # the DataFrame exists, instead of a row-wise pandas max/min afterwards
+    high = prices + rng.uniform(0.5, 2, n_bars)
+    low = prices - rng.uniform(0.5, 2, n_bars)
+    close = prices + rng.uniform(-0.5, 0.5, n_bars)
+    high = np.maximum.reduce([high, prices, close])
+    low = np.minimum.reduce([low, prices, close])
+
+    # Hand pandas one pre-stacked price matrix: the four float columns land
+    # in a single contiguous block with no BlockManager consolidation pass
+    mat = np.empty((n_bars, 4), dtype=np.float64)
+    mat[:, 0] = prices
+    mat[:, 1] = high
+    mat[:, 2] = low
+    mat[:, 3] = close
+    df = pd.DataFrame(mat, columns=['open', 'high', 'low', 'close'])
+    df.insert(0, 'date', dates)
+    df['volume'] = rng.integers(1000000, 10000000, n_bars, dtype=np.int32)
+
     return df
 
 
+def create_sample_ohlcv(n_bars: int = 300, seed: int = 42) -> pd.DataFrame:
+    """Create sample OHLCV data for testing (copy of a cached build)."""
+    return _build_ohlcv_cached(n_bars, seed).copy()
+
+
+# Session-scoped shared fixtures: the engine is stateless per analysis and
+# the sample frames are never mutated in place (the engine copies internally),
+# so rebuilding them per test is pure overhead.
+
+@pytest.fixture(scope="session")
+def engine_config():
+    """Default EngineConfig built once for the whole session."""
+    return EngineConfig()
+
+
+@pytest.fixture(scope="session")
+def engine(engine_config):
+    return VectorizedSMCEngine(engine_config)
+
+
+@pytest.fixture(scope="session")
+def sample_data():
+    return create_sample_ohlcv(300)
+
+
+@pytest.fixture(scope="session")
+def sample_output(engine, sample_data):
+    return engine.analyze(sample_data, symbol="TEST")
+
+
+@pytest.fixture(scope="session")
+def sample_analysis(engine):
+    df = create_sample_ohlcv(200)
+    output = engine.analyze(df, symbol="TEST")
+    signal = SignalGenerator().generate(output, symbol="TEST")
+    return df, output, signal
+
+
 class TestVectorizedSMCEngine:
     """Test the vectorized SMC engine."""
-    
-    @pytest.fixture
-    def engine(self):
-        return VectorizedSMCEngine()
-    
-    @pytest.fixture
-    def sample_data(self):
-        return create_sample_ohlcv(300)
-    
+
     def test_engine_initialization(self, engine):
         """Test engine initializes correctly."""
         assert engine is not None
@@ -90,59 +134,68 @@ class TestVectorizedSMCEngine:
         assert engine.config.swing_length == 30
         assert engine.config.swing_left == 5
     
-    def test_analyze_returns_output(self, engine, sample_data):
+    def test_analyze_returns_output(self, sample_output):
         """Test analyze returns valid output."""
-        result = engine.analyze(sample_data, symbol="TEST")
-        
+        result = sample_output
+
         assert result is not None
         assert isinstance(result, AnalysisOutput)
         assert result.symbol == "TEST"
         assert result.data_points > 0
         assert result.computation_time_ms > 0
-    
-    def test_analyze_detects_swing_points(self, engine, sample_data):
+
+    # The detect_* tests all read different fields of the same analysis,
+    # so they share the session-scoped sample_output instead of re-running
+    # the engine once per assertion group.
+
+    def test_analyze_detects_swing_points(self, sample_output):
         """Test swing point detection."""
-        result = engine.analyze(sample_data, symbol="TEST")
-        
+        result = sample_output
+
         assert len(result.swing_points) > 0
-        
+
         # Check swing points have valid data
         for sp in result.swing_points:
             assert sp.index >= 0
             assert sp.price > 0
             assert isinstance(sp.is_high, bool)
-    
-    def test_analyze_detects_order_blocks(self, engine, sample_data):
+
+    def test_analyze_detects_order_blocks(self, sample_output):
         """Test order block detection."""
-        result = engine.analyze(sample_data, symbol="TEST")
-        
+        result = sample_output
+
         # Should have some OBs
         assert len(result.order_blocks) >= 0
-        
+
         for ob in result.order_blocks:
             assert ob.top > ob.bottom
             assert ob.type in [OBType.BULLISH, OBType.BEARISH]
-    
-    def test_analyze_detects_fvgs(self, engine, sample_data):
+
+    def test_analyze_detects_fvgs(self, sample_output):
         """Test FVG detection."""
-        result = engine.analyze(sample_data, symbol="TEST")
-        
+        result = sample_output
+
         # Check FVG data structure
         for fvg in result.fvgs:
             assert fvg.top > fvg.bottom
             assert fvg.type in [FVGType.BULLISH, FVGType.BEARISH]
-    
-    def test_analyze_detects_market_state(self, engine, sample_data):
+
+    def test_analyze_detects_market_state(self, sample_output):
         """Test market state analysis."""
-        result = engine.analyze(sample_data, symbol="TEST")
-        
+        result = sample_output
+
         assert result.market_state is not None
         assert result.market_state.trend in [TrendDirection.BULLISH, TrendDirection.BEARISH, TrendDirection.NEUTRAL]
         assert result.market_state.zone in [ZoneType.PREMIUM, ZoneType.DISCOUNT, ZoneType.EQUILIBRIUM]
         assert result.market_state.current_price > 0
     
+    @pytest.mark.perf
     def test_analyze_performance(self, engine):
         """Test analysis performance on large dataset."""
+        # Wall-clock assertion; meaningless under tracing or coverage
+        if sys.gettrace() is not None or os.environ.get("COVERAGE_RUN"):
+            pytest.skip("performance assertion unreliable under tracing/coverage")
+
         # Create 10,000 bars
         large_data = create_sample_ohlcv(10000)
         
@@ -151,6 +204,8 @@ class TestVectorizedSMCEngine:
         # Should complete in under 500ms (reasonable for 10K bars)
         assert result.computation_time_ms < 500
         assert result.data_points == 10000
+        # Regression-lock the row-major layout on the engine boundary
+        assert engine._ohlcv.flags['C_CONTIGUOUS']
     
     def test_analyze_with_insufficient_data(self, engine):
         """Test handling of insufficient data."""
@@ -177,13 +232,7 @@ class TestSignalGenerator:
     @pytest.fixture
     def generator(self):
         return SignalGenerator()
-    
-    @pytest.fixture
-    def sample_output(self):
-        engine = VectorizedSMCEngine()
-        df = create_sample_ohlcv(300)
-        return engine.analyze(df, symbol="TEST")
-    
+
     def test_generator_initialization(self, generator):
         """Test generator initializes correctly."""
         assert generator is not None
@@ -267,17 +316,13 @@ class TestRiskManager:
         assert tp2 == 100 + risk * 3  # 115
         assert tp3 == 100 + risk * 5  # 125
     
-    def test_risk_assessment(self, risk_manager):
+    def test_risk_assessment(self, risk_manager, sample_output):
         """Test risk assessment."""
-        engine = VectorizedSMCEngine()
-        df = create_sample_ohlcv(300)
-        output = engine.analyze(df, symbol="TEST")
-        
         generator = SignalGenerator(risk_manager)
-        signal = generator.generate(output, symbol="TEST")
-        
-        risk = risk_manager.assess_risk(signal, output)
-        
+        signal = generator.generate(sample_output, symbol="TEST")
+
+        risk = risk_manager.assess_risk(signal, sample_output)
+
         assert 0 <= risk <= 100
 
 
@@ -287,18 +332,7 @@ class TestPremiumChartBuilder:
     @pytest.fixture
     def builder(self):
         return PremiumChartBuilder()
-    
-    @pytest.fixture
-    def sample_analysis(self):
-        engine = VectorizedSMCEngine()
-        df = create_sample_ohlcv(200)
-        output = engine.analyze(df, symbol="TEST")
-        
-        generator = SignalGenerator()
-        signal = generator.generate(output, symbol="TEST")
-        
-        return df, output, signal
-    
+
     def test_build_chart(self, builder, sample_analysis):
         """Test chart building."""
         df, output, signal = sample_analysis
@@ -317,25 +351,28 @@ class TestPremiumChartBuilder:
         
         builder.save(fig, filepath)
         
-        assert filepath.exists()
-        assert filepath.stat().st_size > 0
+        # One stat call covers both existence and content
+        assert os.stat(filepath).st_size > 0
 
 
 class TestOrchestrator:
     """Test the orchestrator."""
-    
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def class_tmp(tmp_path_factory):
+        """One temp root for the class; tests get cheap subdirectories."""
+        return tmp_path_factory.mktemp("orch")
+
     @pytest.fixture
-    def orchestrator(self, tmp_path):
+    def orchestrator(self, class_tmp):
+        sub = class_tmp / uuid.uuid4().hex[:8]
         config = OrchestratorConfig(
-            data_dir=tmp_path / "data",
-            output_dir=tmp_path / "output",
+            data_dir=sub / "data",
+            output_dir=sub / "output",
         )
         return SMCOrchestrator(config)
-    
-    @pytest.fixture
-    def sample_data(self):
-        return create_sample_ohlcv(300)
-    
+
     def test_orchestrator_initialization(self, orchestrator):
         """Test orchestrator initializes correctly."""
         assert orchestrator is not None
@@ -367,13 +404,18 @@ class TestOrchestrator:
         assert result.chart_path is not None
         assert result.chart_path.exists()
     
-    def test_stats_tracking(self, orchestrator, sample_data):
+    def test_stats_tracking(self, orchestrator, sample_data, sample_output):
         """Test statistics tracking."""
+        # The counters only care that analyze ran; stub the engine with the
+        # pre-built output so this doesn't cost two full engine runs
+        orchestrator.engine = Mock(spec=VectorizedSMCEngine)
+        orchestrator.engine.analyze.return_value = sample_output
+
         orchestrator.analyze(sample_data, symbol="TEST1")
         orchestrator.analyze(sample_data, symbol="TEST2")
-        
+
         stats = orchestrator.get_stats()
-        
+
         assert stats['total_analyses'] == 2
         assert stats['successful_analyses'] == 2
 
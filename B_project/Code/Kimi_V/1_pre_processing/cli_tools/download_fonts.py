@@ -1,8 +1,10 @@
-import os
-import requests
+import asyncio
 from pathlib import Path
+
+import aiofiles
+import aiohttp
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn
+from rich.progress import Progress, TextColumn, BarColumn, DownloadColumn, TransferSpeedColumn
 
 console = Console()
 
@@ -13,26 +15,19 @@ FONTS_CONFIG = {
     "HarmonyOS_Sans_SC_Bold.ttf": "https://github.com/googlefonts/noto-cjk/raw/main/Sans/OTF/Chinese-Simplified/NotoSansCJKsc-Bold.otf", # 备选
 }
 
-def download_font(url, dest_path):
-    response = requests.get(url, stream=True)
-    total_size = int(response.headers.get('content-length', 0))
-    
-    with Progress(
-        TextColumn("[bold blue]{task.fields[filename]}", justify="right"),
-        BarColumn(bar_width=40),
-        "[progress.percentage]{task.percentage:>3.1f}%",
-        "•",
-        DownloadColumn(),
-        "•",
-        TransferSpeedColumn(),
-    ) as progress:
-        task = progress.add_task("download", total=total_size, filename=dest_path.name)
-        with open(dest_path, "wb") as f:
-            for data in response.iter_content(chunk_size=1024):
-                size = f.write(data)
-                progress.update(task, advance=size)
-
-def main():
+async def download_font(session, url, dest_path, progress):
+    """单个字体的异步流式下载, 进度挂到共享 Progress 的独立任务行"""
+    task = progress.add_task("download", total=None, filename=dest_path.name)
+    async with session.get(url) as response:
+        total_size = int(response.headers.get('content-length', 0))
+        progress.update(task, total=total_size or None)
+        async with aiofiles.open(dest_path, "wb") as f:
+            # 64KB 块减少 write 调用次数
+            async for data in response.content.iter_chunked(64 * 1024):
+                await f.write(data)
+                progress.update(task, advance=len(data))
+
+async def main():
     # 遵循我们重构后的路径规范
     PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
     FONT_DIR = PROJECT_ROOT / "storage" / "fonts"
@@ -41,20 +36,38 @@ def main():
     console.print(f"[bold green]🚀 字体下载器启动[/bold green]")
     console.print(f"目标目录: [cyan]{FONT_DIR}[/cyan]\n")
 
+    pending = []
     for name, url in FONTS_CONFIG.items():
-        dest = FONT_DIR / name
-        if dest.exists():
+        if (FONT_DIR / name).exists():
             console.print(f"⏩ [yellow]{name}[/yellow] 已存在，跳过。")
-            continue
-        
-        try:
-            console.print(f"📥 正在下载 [bold]{name}[/bold]...")
-            download_font(url, dest)
-            console.print(f"✅ [green]{name}[/green] 下载完成！")
-        except Exception as e:
-            console.print(f"❌ 下载 [red]{name}[/red] 失败: {e}")
+        else:
+            pending.append((name, url))
+
+    if pending:
+        # 三个下载都是网络延迟主导且相互独立, 并发拉取
+        with Progress(
+            TextColumn("[bold blue]{task.fields[filename]}", justify="right"),
+            BarColumn(bar_width=40),
+            "[progress.percentage]{task.percentage:>3.1f}%",
+            "•",
+            DownloadColumn(),
+            "•",
+            TransferSpeedColumn(),
+        ) as progress:
+            async with aiohttp.ClientSession() as session:
+                results = await asyncio.gather(
+                    *[download_font(session, url, FONT_DIR / name, progress)
+                      for name, url in pending],
+                    return_exceptions=True,
+                )
+
+        for (name, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                console.print(f"❌ 下载 [red]{name}[/red] 失败: {result}")
+            else:
+                console.print(f"✅ [green]{name}[/green] 下载完成！")
 
     console.print("\n[bold green]✨ 所有字体处理完毕！[/bold green]")
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -14,49 +14,101 @@ console = Console()
 PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
 COOKIES_DIR = PROJECT_ROOT / "1_pre_processing" / "scrapers"
 COOKIES_FILE = COOKIES_DIR / "twitter_cookies.json"
+TWIKIT_COOKIES_FILE = COOKIES_DIR / "twitter_cookies.twikit.json"
+STORAGE_STATE_FILE = COOKIES_DIR / "twitter_storage_state.json"
 USER_DATA_DIR = PROJECT_ROOT / "storage" / "browser_data" / "twitter_profile"
+# CDP 锁文件: 记录正在运行的持久化浏览器的调试端口, 供后续调用附着复用
+CDP_LOCK_FILE = PROJECT_ROOT / "storage" / "browser_data" / "twitter_cdp.lock"
+CDP_PORT = 9222
 
 COOKIES_DIR.mkdir(parents=True, exist_ok=True)
 USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+
+async def _connect_existing(p):
+    """尝试通过 CDP 附着到已在运行的持久化浏览器。
+
+    Chromium 冷启动要拉起 browser/GPU/renderer 整棵进程树，
+    若锁文件记录的实例仍然存活则直接复用，失败时清理锁文件走冷启动。
+    返回 (browser, context)，未能附着时返回 (None, None)。
+    """
+    if not CDP_LOCK_FILE.exists():
+        return None, None
+    try:
+        port = int(CDP_LOCK_FILE.read_text().strip())
+        browser = await p.chromium.connect_over_cdp(f"http://127.0.0.1:{port}")
+        context = browser.contexts[0] if browser.contexts else await browser.new_context()
+        return browser, context
+    except Exception:
+        CDP_LOCK_FILE.unlink(missing_ok=True)
+        return None, None
+
+
 async def main():
     console.print(Panel.fit("[bold cyan]Twitter Cookie 获取工具[/bold cyan]"))
-    
+
     async with async_playwright() as p:
-        # 尝试寻找 Chrome 路径
-        executable_path = None
-        if platform.system() == "Linux":
-            for p_path in ["/usr/bin/google-chrome-stable", "/usr/bin/google-chrome", "/bin/google-chrome-stable"]:
-                if os.path.exists(p_path):
-                    executable_path = p_path
-                    break
-        
-        console.print(f"[info]正在启动浏览器... 用户数据目录: {USER_DATA_DIR}[/info]")
-        
-        context = await p.chromium.launch_persistent_context(
-            user_data_dir=str(USER_DATA_DIR),
-            executable_path=executable_path,
-            headless=False,
-            args=["--no-sandbox", "--disable-blink-features=AutomationControlled"],
-            viewport={"width": 1280, "height": 720}
-        )
+        browser, context = await _connect_existing(p)
+        attached = context is not None
+
+        if attached:
+            console.print("[info]检测到正在运行的浏览器实例，通过 CDP 复用（跳过冷启动）[/info]")
+        else:
+            # 尝试寻找 Chrome 路径
+            executable_path = None
+            if platform.system() == "Linux":
+                for p_path in ["/usr/bin/google-chrome-stable", "/usr/bin/google-chrome", "/bin/google-chrome-stable"]:
+                    if os.path.exists(p_path):
+                        executable_path = p_path
+                        break
+
+            console.print(f"[info]正在启动浏览器... 用户数据目录: {USER_DATA_DIR}[/info]")
+
+            context = await p.chromium.launch_persistent_context(
+                user_data_dir=str(USER_DATA_DIR),
+                executable_path=executable_path,
+                headless=False,
+                args=[
+                    "--no-sandbox",
+                    "--disable-blink-features=AutomationControlled",
+                    f"--remote-debugging-port={CDP_PORT}",
+                ],
+                viewport={"width": 1280, "height": 720}
+            )
+            # 运行期间其他工具可凭锁文件附着到同一实例
+            CDP_LOCK_FILE.write_text(str(CDP_PORT), encoding="utf-8")
 
         page = context.pages[0] if context.pages else await context.new_page()
-        
+
         console.print("[yellow]请在打开的浏览器中登录 Twitter (X)。[/yellow]")
         console.print("[yellow]登录成功并回到首页后，回到这里按 Enter 键保存 Cookie。[/yellow]")
-        
+
         await page.goto("https://x.com/home")
-        
-        # 使用 asyncio.to_thread 处理同步 input 避免阻塞事件循环
-        await asyncio.to_thread(input, "\n完成登录后按 Enter 键继续...")
-        
+
+        # 在线程池里跑同步 input 避免阻塞事件循环;
+        # 直接 run_in_executor 省去 to_thread 的 contextvars 拷贝包装
+        await asyncio.get_running_loop().run_in_executor(
+            None, input, "\n完成登录后按 Enter 键继续..."
+        )
+
         cookies = await context.cookies()
+        # 内存中序列化完再一次性写入, 避免 json.dump 逐 token 的小块 write
         with open(COOKIES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cookies, f, indent=2)
-            
+            f.write(json.dumps(cookies, indent=2, ensure_ascii=False))
+
+        # 同时落盘 twikit 格式 ({name: value}) 与 storageState,
+        # twitter.py 可直接加载前者, 跳过 Playwright→twikit 的转换分支
+        with open(TWIKIT_COOKIES_FILE, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({c["name"]: c["value"] for c in cookies}, ensure_ascii=False))
+        await context.storage_state(path=str(STORAGE_STATE_FILE))
+
         console.print(f"[bold green]✅ Cookie 已保存至: {COOKIES_FILE}[/bold green]")
-        await context.close()
+        if attached:
+            # 仅断开 CDP 连接, 浏览器实例继续运行供下次复用
+            await browser.close()
+        else:
+            await context.close()
+            CDP_LOCK_FILE.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,10 +1,12 @@
 import os, sys
 import platform
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 
-# Add project root to sys.path
-PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
+# Add project root to sys.path (cli_tools 独立运行, 不走 scrapers/_bootstrap)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
@@ -17,21 +19,106 @@ __     ___     _            _     _
                                           |___/        
 """
 
+# 每次 pip 冷启动约 1-2s(解释器 + 解析器初始化), 公共参数:
+# 跳过版本自检网络请求, 安装时不预编译 .pyc (plotly 级别的包编译很耗时)
+PIP_FLAGS = ["--disable-pip-version-check", "--no-compile"]
+
+BOOTSTRAP_PACKAGES = ("requests", "rich", "ruamel.yaml", "InquirerPy", "pandas", "openpyxl")
+
 def install_package(*packages):
-    subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+    subprocess.check_call([sys.executable, "-m", "pip", "install", *PIP_FLAGS, *packages])
+
+def bootstrap_ui():
+    """仅当交互依赖缺失时才调 pip, 重复运行安装器时省掉整次 pip 调用"""
+    try:
+        import rich  # noqa: F401
+        import InquirerPy  # noqa: F401
+    except ImportError:
+        install_package(*BOOTSTRAP_PACKAGES)
+
+def _parse_requirements(path):
+    """读取 requirements.txt 的包名列表 (跳过注释与 -r/--xxx 选项行)"""
+    reqs = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line and not line.startswith("-"):
+            reqs.append(line)
+    return reqs
+
+def prefetch_wheels(req_list, dest: Path) -> bool:
+    """并发预下载纯 Python wheel 到本地 wheelhouse。
+
+    pip 自身是串行下载的, 网络延迟是大头; 这里用 8 线程先把
+    PyPI JSON API 能解析出的 py3-none-any wheel 拉到本地,
+    随后 pip 以 --find-links 命中缓存。返回是否全部命中
+    (全部命中时可叠加 --no-index 完全跳过索引查询)。
+    """
+    import json
+    import re
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+
+    dest.mkdir(parents=True, exist_ok=True)
+
+    def fetch_one(req) -> bool:
+        try:
+            m = re.match(r"^([A-Za-z0-9_.\-]+)\s*(?:==\s*([^;\s]+))?", req)
+            if not m:
+                return False
+            name, version = m.group(1), m.group(2)
+            api = (f"https://pypi.org/pypi/{name}/{version}/json" if version
+                   else f"https://pypi.org/pypi/{name}/json")
+            with urllib.request.urlopen(api, timeout=15) as resp:
+                data = json.loads(resp.read())
+            for file_info in data.get("urls", []):
+                # 只预取纯 Python wheel, 平台相关 wheel 交给 pip 自己挑
+                if file_info["filename"].endswith("py3-none-any.whl"):
+                    target = dest / file_info["filename"]
+                    if not target.exists():
+                        urllib.request.urlretrieve(file_info["url"], target)
+                    return True
+            return False
+        except Exception:
+            return False
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        hits = list(pool.map(fetch_one, req_list))
+    return bool(hits) and all(hits)
+
+# ffmpeg 探测结果的哨兵文件: 记录上次探测成功时的可执行文件路径
+FFMPEG_SENTINEL = PROJECT_ROOT / "storage" / ".ffmpeg_ok"
+
+@lru_cache(maxsize=1)
+def _system() -> str:
+    return platform.system()
 
 def check_ffmpeg():
     from rich.console import Console
     from rich.panel import Panel
     console = Console()
 
+    # 哨兵命中且 ffmpeg 路径未变时跳过 fork+exec 的子进程探测
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path and FFMPEG_SENTINEL.exists():
+        try:
+            if FFMPEG_SENTINEL.read_text(encoding="utf-8").strip() == ffmpeg_path:
+                console.print(Panel("✅ FFmpeg is already installed", style="green"))
+                return True
+        except Exception:
+            pass
+
     try:
         # Check if ffmpeg is installed
         subprocess.run(['ffmpeg', '-version'], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        try:
+            FFMPEG_SENTINEL.parent.mkdir(parents=True, exist_ok=True)
+            FFMPEG_SENTINEL.write_text(ffmpeg_path or "ffmpeg", encoding="utf-8")
+        except Exception:
+            pass
         console.print(Panel("✅ FFmpeg is already installed", style="green"))
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
-        system = platform.system()
+        system = _system()
         install_cmd = ""
         
         if system == "Windows":
@@ -54,7 +141,7 @@ def check_ffmpeg():
         return False
 
 def main():
-    install_package("requests", "rich", "ruamel.yaml", "InquirerPy", "pandas", "openpyxl")
+    bootstrap_ui()
     from rich.console import Console
     from rich.panel import Panel
     from rich.box import DOUBLE
@@ -86,7 +173,20 @@ def main():
     @except_handler("Failed to install project requirements")
     def install_requirements():
         console.print(Panel("Installing dependencies from requirements.txt...", style="cyan"))
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # 先并发预取 wheel, 预取失败时退回普通 pip 安装
+        wheelhouse = PROJECT_ROOT / "storage" / "wheelhouse"
+        extra_args = []
+        try:
+            reqs = _parse_requirements("requirements.txt") + list(BOOTSTRAP_PACKAGES)
+            all_hit = prefetch_wheels(reqs, wheelhouse)
+            if any(wheelhouse.glob("*.whl")):
+                extra_args = ["--find-links", str(wheelhouse)]
+                if all_hit:
+                    extra_args.append("--no-index")
+        except Exception:
+            extra_args = []
+        # requirements 和显式包合并成一次 pip 调用
+        install_package(*extra_args, "-r", "requirements.txt", *BOOTSTRAP_PACKAGES)
 
     install_requirements()
     check_ffmpeg()
@@ -27,21 +27,26 @@ _base_scraper.py
 }
 """
 
-import sys
-from pathlib import Path
+import html
+import re
+import unicodedata
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Dict, Optional
 
-# 确保项目根目录在 sys.path 中
-PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from _bootstrap import PROJECT_ROOT  # noqa: F401  确保项目根目录在 sys.path 中
 
 from shared.paths import TASKS_EXCEL
 from shared.state import load_visited
 from shared.logger import console
 
 
+# 硬编码的通用黑名单 (低价值/营销内容)
+GLOBAL_BLACKLIST = [
+    "Giveaway", "Winners", "Crypto", "NFT", "Airdrop",
+    "Live now", "Broadcast", "Streaming",
+]
+
 # 标准数据字段
 STANDARD_COLUMNS = [
     'Score', 'AI Score', 'Video File', 'title', 'Category', 'AI Reason', 'rawtext',
@@ -72,6 +77,57 @@ DEFAULT_VALUES = {
     'Status': '',
 }
 
+# make_entry 的查表结构: 下划线别名与标准名都映射到标准列名,
+# 默认值冻结成私有 dict, 每条记录一次 C 级 .copy() 即可
+# (比 dict(tuple) 再快数倍; 18 个共享默认值只存一份)
+_KEY_MAP = {k.replace(" ", "_"): k for k in STANDARD_COLUMNS}
+_KEY_MAP.update({k: k for k in STANDARD_COLUMNS})
+_DEFAULTS = dict(DEFAULT_VALUES)
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def clean_text(s: str) -> str:
+    """标题/正文规范化: HTML 实体解码 + NFKC + 空白折叠一次完成。
+
+    采集时就产出规范形式, 下游不用再各自做 replace 链清洗。
+    """
+    return _WS_RE.sub(" ", html.unescape(unicodedata.normalize("NFKC", s))).strip()
+
+
+def make_connector(limit: int):
+    """构造统一调优的 aiohttp 连接池。
+
+    keepalive + DNS 缓存让同一采集器的几十上百个小请求摊薄
+    TLS/TCP 握手成本。TCPConnector 绑定事件循环, 而各采集器在
+    workflow 里跑在各自线程的独立 loop 上, 所以这里按调用新建
+    而非进程级共享单例。
+    """
+    import aiohttp
+    return aiohttp.TCPConnector(
+        limit=limit,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        enable_cleanup_closed=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def _blacklist_pattern():
+    """黑名单正则整个进程只解析/编译一次, 三个采集器实例共享。
+
+    领域配置读取 + 编译成单个不区分大小写的正则,
+    validate_content 里每个标题只剩一次 C 级扫描。
+    """
+    try:
+        from shared.domain import domain
+        custom_blacklist = domain.get("scrapers.common_blacklist", [])
+    except Exception:
+        custom_blacklist = []
+    terms = GLOBAL_BLACKLIST + list(custom_blacklist)
+    return re.compile("|".join(map(re.escape, terms)), re.IGNORECASE)
+
 
 class BaseScraper(ABC):
     """
@@ -86,6 +142,7 @@ class BaseScraper(ABC):
 
     def __init__(self):
         self.visited_urls = load_visited()
+        self._blacklist_re = _blacklist_pattern()
 
     def is_new(self, url: str) -> bool:
         """检查 URL 是否为新视频（未在已访问集合中）"""
@@ -96,26 +153,7 @@ class BaseScraper(ABC):
         通用内容预筛选
         返回 True 表示内容有效（保留），False 表示应被过滤
         """
-        # 1. 硬编码的通用黑名单 (低价值/营销内容)
-        GLOBAL_BLACKLIST = [
-            "Giveaway", "Winners", "Crypto", "NFT", "Airdrop", 
-            "Live now", "Broadcast", "Streaming"
-        ]
-        
-        # 2. 尝试从领域配置读取自定义黑名单
-        try:
-            from shared.domain import domain
-            custom_blacklist = domain.get("scrapers.common_blacklist", [])
-            blacklist = GLOBAL_BLACKLIST + custom_blacklist
-        except:
-            blacklist = GLOBAL_BLACKLIST
-
-        title_lower = title.lower()
-        for word in blacklist:
-            if word.lower() in title_lower:
-                # console.print(f"  [dim yellow]过滤无关内容: {title[:20]}... (包含 '{word}')[/dim yellow]")
-                return False
-        return True
+        return self._blacklist_re.search(title) is None
 
     @abstractmethod
     def fetch(self) -> List[Dict]:
@@ -142,14 +180,12 @@ class BaseScraper(ABC):
 
         参数名中的下划线会被转为空格（如 Video_File -> "Video File"）
         """
-        entry = DEFAULT_VALUES.copy()
+        entry = _DEFAULTS.copy()
         for k, v in kwargs.items():
-            key = k.replace("_", " ") if k.replace("_", " ") in STANDARD_COLUMNS else k
-            # 也支持直接用标准 key 名
-            if key in entry:
+            key = _KEY_MAP.get(k)
+            # 非标准字段照旧忽略
+            if key is not None:
                 entry[key] = v
-            elif k in entry:
-                entry[k] = v
         return entry
 
     def run(self) -> List[Dict]:
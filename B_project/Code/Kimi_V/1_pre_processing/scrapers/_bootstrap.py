@@ -0,0 +1,19 @@
+"""
+_bootstrap.py
+-------------
+采集器共用的路径引导 — 把项目根目录加入 sys.path。
+
+各采集器原本各自计算 PROJECT_ROOT（三次 dirname 字符串操作）并探测
+sys.path；统一到这里后借助模块缓存整个进程只执行一次，
+sys.path 里也不会出现重复条目拖慢每次 import miss 的扫描。
+
+使用方式: from _bootstrap import PROJECT_ROOT
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
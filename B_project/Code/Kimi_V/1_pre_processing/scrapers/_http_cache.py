@@ -0,0 +1,69 @@
+"""
+_http_cache.py
+--------------
+HTTP 条件请求缓存（ETag / Last-Modified）。
+
+采集器每次全量重拉 feed，即使内容没变；把响应头里的 ETag /
+Last-Modified 记下来，下次带上 If-None-Match / If-Modified-Since，
+服务端返回 304 时直接复用上次解析好的 JSON —— 无响应体下载、
+无重复解析，对没更新的频道近乎零成本。
+
+缓存整体用 orjson 落盘为单个文件，写临时文件再改名保证原子性。
+"""
+
+import hashlib
+
+import orjson
+
+
+class HttpCache:
+
+    def __init__(self, path):
+        self._path = path
+        self._dirty = False
+        try:
+            self._data = orjson.loads(path.read_bytes()) if path.exists() else {}
+        except Exception:
+            self._data = {}
+
+    @staticmethod
+    def key(url, params=None) -> str:
+        """URL + 规范化参数的稳定哈希"""
+        raw = orjson.dumps([url, sorted((params or {}).items())])
+        return hashlib.sha1(raw).hexdigest()
+
+    def conditional_headers(self, key) -> dict:
+        entry = self._data.get(key)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def cached_payload(self, key):
+        entry = self._data.get(key)
+        return entry["payload"] if entry else None
+
+    def store(self, key, resp_headers, payload):
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+        # 服务端不支持条件请求时不浪费磁盘
+        if not etag and not last_modified:
+            return
+        self._data[key] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "payload": payload,
+        }
+        self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_bytes(orjson.dumps(self._data))
+        tmp.replace(self._path)
+        self._dirty = False
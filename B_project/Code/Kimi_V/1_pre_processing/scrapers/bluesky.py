@@ -5,28 +5,41 @@ Bluesky 视频采集器。
 
 通过 Bluesky 公共 API 抓取指定用户的视频帖子。
 无需认证（使用公开 API），支持重试机制。
+各目标用户并发抓取（与 youtube.py 同构的 aiohttp + Semaphore 模式）。
 
 配置来源：configs/config.yaml → bluesky_scrapers.*
 """
 
-import sys
-import requests
-from pathlib import Path
+import asyncio
+import platform
+import time
+import aiohttp
+import orjson
 from typing import List, Dict, Optional
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from _bootstrap import PROJECT_ROOT  # noqa: F401  确保项目根目录在 sys.path 中
 
 from shared.domain import domain
-from _base_scraper import BaseScraper
+from shared.paths import PRE_PROCESSING
+from _base_scraper import BaseScraper, clean_text, make_connector
+from _http_cache import HttpCache
+
+
+# handle -> DID 基本不变, 落盘缓存 30 天, 热启动省掉 N 次解析请求
+_DID_CACHE_PATH = PRE_PROCESSING / "scrapers" / ".bluesky_did_cache.json"
+_DID_TTL_SECONDS = 30 * 86400
+_HTTP_CACHE_PATH = PRE_PROCESSING / "scrapers" / ".bluesky_http_cache.json"
 
 
 class BlueskyScraper(BaseScraper):
     name = "Bluesky"
 
+    # 重试策略 (对齐原 urllib3 Retry(total=3, backoff_factor=0.5, 5xx))
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = {500, 502, 503, 504}
+    CONCURRENT_LIMIT = 8
+
     def __init__(self):
         super().__init__()
         # 领域配置（从 domain profile 读取）
@@ -35,44 +48,83 @@ class BlueskyScraper(BaseScraper):
         self.targets = bs_config.get("targets", [])
         self.api_root = "https://public.api.bsky.app/xrpc"
 
-        # 带重试的 session
-        self.session = requests.Session()
-        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
-
-    def _get(self, endpoint, params=None) -> Optional[dict]:
-        try:
-            resp = self.session.get(f"{self.api_root}/{endpoint}", params=params, timeout=10)
-            resp.raise_for_status()
-            return resp.json()
-        except Exception:
+        # 所有请求共享同一个限速器
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self._did_cache = self._load_did_cache()
+        self._did_dirty = False
+        # 条件请求缓存: Feed 没更新时命中 304, 复用上次解析结果
+        self._http_cache = HttpCache(_HTTP_CACHE_PATH)
+
+    @staticmethod
+    def _load_did_cache() -> dict:
+        if _DID_CACHE_PATH.exists():
+            try:
+                return orjson.loads(_DID_CACHE_PATH.read_bytes())
+            except Exception:
+                return {}
+        return {}
+
+    def _save_did_cache(self):
+        # 写临时文件再改名, 避免写一半被并发读到
+        tmp = _DID_CACHE_PATH.with_suffix(".json.tmp")
+        tmp.write_bytes(orjson.dumps(self._did_cache))
+        tmp.replace(_DID_CACHE_PATH)
+
+    async def _get(self, session, endpoint, params=None) -> Optional[dict]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.CONCURRENT_LIMIT)
+        url = f"{self.api_root}/{endpoint}"
+        cache_key = HttpCache.key(url, params)
+        async with self._semaphore:
+            for attempt in range(self.RETRY_TOTAL):
+                try:
+                    headers = self._http_cache.conditional_headers(cache_key)
+                    async with session.get(url, params=params, headers=headers) as resp:
+                        if resp.status in self.RETRY_STATUSES:
+                            raise aiohttp.ClientResponseError(
+                                resp.request_info, resp.history, status=resp.status)
+                        if resp.status == 304:
+                            return self._http_cache.cached_payload(cache_key)
+                        if resp.status != 200:
+                            return None
+                        # orjson 解析大响应比 stdlib json 快数倍
+                        data = orjson.loads(await resp.read())
+                        self._http_cache.store(cache_key, resp.headers, data)
+                        return data
+                except Exception:
+                    if attempt == self.RETRY_TOTAL - 1:
+                        return None
+                    await asyncio.sleep(self.RETRY_BACKOFF * (2 ** attempt))
             return None
 
-    def _resolve_handle(self, handle: str) -> Optional[str]:
-        data = self._get("com.atproto.identity.resolveHandle", {"handle": handle})
-        return data.get("did") if data else None
-
-    def _get_user_videos(self, handle: str) -> List[Dict]:
+    async def _resolve_handle(self, session, handle: str) -> Optional[str]:
+        entry = self._did_cache.get(handle)
+        if entry and time.time() - entry["ts"] < _DID_TTL_SECONDS:
+            return entry["did"]
+        data = await self._get(session, "com.atproto.identity.resolveHandle", {"handle": handle})
+        did = data.get("did") if data else None
+        if did:
+            self._did_cache[handle] = {"did": did, "ts": time.time()}
+            self._did_dirty = True
+        return did
+
+    async def _get_user_videos(self, session, handle: str) -> List[Dict]:
         from shared.logger import console
         console.print(f"    [dim]🔍 正在抓取 Bluesky 用户: {handle}...[/dim]")
-        
-        did = self._resolve_handle(handle)
+
+        did = await self._resolve_handle(session, handle)
         if not did:
             console.print(f"      [dim red]无法解析用户 DID: {handle}[/dim red]")
             return []
-        
+
         # Bluesky API: getAuthorFeed
         # 参数: actor, limit, filter (posts_with_video, posts_no_replies, etc)
         # 注意: 'filter' 参数在某些版本的 API 中可能不可用或行为不同
         params = {"actor": did, "limit": self.check_limit, "filter": "posts_with_video"}
-        
-        try:
-            # getAuthorFeed 返回的是 FeedViewPost 列表
-            resp = self.session.get(f"{self.api_root}/app.bsky.feed.getAuthorFeed", params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception:
-             return []
+
+        # getAuthorFeed 返回的是 FeedViewPost 列表
+        data = await self._get(session, "app.bsky.feed.getAuthorFeed", params)
 
         if not data or "feed" not in data:
             console.print(f"      [dim]未获取到 Feed 数据[/dim]")
@@ -113,8 +165,8 @@ class BlueskyScraper(BaseScraper):
             post_id = uri.split("/")[-1]
             url = f"https://bsky.app/profile/{handle}/post/{post_id}"
             
-            text = record.get("text", "")
-            
+            text = clean_text(record.get("text", ""))
+
             # 内容预筛选
             if not self.validate_content(text):
                 return None
@@ -137,7 +189,7 @@ class BlueskyScraper(BaseScraper):
             # 保持为 0，依靠 workflow_1_pre.py 中的 yt-dlp 补全逻辑
             
             return self.make_entry(
-                title=text.replace("\n", " ").strip()[:50] or "No Title",
+                title=text[:50] or "No Title",
                 rawtext=text,
                 duration=duration,
                 viewCount=post.get("likeCount", 0),
@@ -149,15 +201,42 @@ class BlueskyScraper(BaseScraper):
         except Exception:
             return None
 
+    # ---------- 异步主逻辑 ----------
+
+    async def _fetch_async(self) -> List[Dict]:
+        # 显式连接池: 并发数对齐信号量, DNS 缓存 + keepalive 让
+        # resolveHandle 与 getAuthorFeed 复用同一条 TLS 连接
+        connector = make_connector(self.CONCURRENT_LIMIT)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=10)
+        ) as session:
+            tasks = [
+                self._get_user_videos(session, handle)
+                for handle in self.targets
+            ]
+            all_videos = []
+            for coro in asyncio.as_completed(tasks):
+                all_videos.extend(await coro)
+
+        if self._did_dirty:
+            try:
+                self._save_did_cache()
+            except Exception:
+                pass
+        try:
+            self._http_cache.save()
+        except Exception:
+            pass
+        return all_videos
+
+    # ---------- 标准接口 ----------
+
     def fetch(self) -> List[Dict]:
         if not self.targets:
             return []
-
-        all_videos = []
-        for handle in self.targets:
-            videos = self._get_user_videos(handle)
-            all_videos.extend(videos)
-        return all_videos
+        if platform.system() == "Windows":
+            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return asyncio.run(self._fetch_async())
 
 
 # 保持旧接口兼容
@@ -12,23 +12,18 @@ X (Twitter) 视频采集器。
 """
 
 import asyncio
-import json
-import os
+import orjson
 import random
-import sys
 import platform
-from pathlib import Path
 from typing import List, Dict
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from _bootstrap import PROJECT_ROOT  # noqa: F401  确保项目根目录在 sys.path 中
 
 from twikit import Client
 from core.utils.config_utils import load_key
 from shared.paths import TASKS_EXCEL, PRE_PROCESSING
 from shared.domain import domain
-from _base_scraper import BaseScraper
+from _base_scraper import BaseScraper, clean_text
 
 
 # 从领域配置读取账号列表
@@ -41,6 +36,8 @@ def _get_accounts() -> list:
 COOKIES_PATH = PRE_PROCESSING / "scrapers" / "twitter_cookies.json"
 if not COOKIES_PATH.exists():
     COOKIES_PATH = PRE_PROCESSING / "scrapers" / "cookies.json"
+# get_twitter_cookies.py 预先转换好的 twikit 格式 ({name: value})
+TWIKIT_COOKIES_PATH = PRE_PROCESSING / "scrapers" / "twitter_cookies.twikit.json"
 
 
 def _get_val(obj, key, default=None):
@@ -51,6 +48,42 @@ def _get_val(obj, key, default=None):
     return getattr(obj, key, default)
 
 
+def _make_getter(obj):
+    """按对象类型一次性选定取值函数。
+
+    同一条推文的多个热字段访问共用它, 省去 _get_val
+    每次调用里的 isinstance 分支。
+    """
+    if isinstance(obj, dict):
+        return lambda o, k, d=None: o.get(k, d)
+    return lambda o, k, d=None: getattr(o, k, d)
+
+
+class _LeakyBucket:
+    """简易漏桶限速器: 允许 capacity 次突发, 之后按 rate 排队。
+
+    代替标签页之间固定的 asyncio.sleep —— 不互相争抢配额的账号
+    可以背靠背跑完, 整体吞吐贴着速率上限而不是 N x 固定等待。
+    """
+
+    def __init__(self, rate: float, capacity: int = 4):
+        self._interval = 1.0 / rate
+        self._capacity = capacity
+        self._next_free = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            slot = max(self._next_free, now - (self._capacity - 1) * self._interval)
+            self._next_free = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            # 少量抖动, 避免多任务在同一时刻齐发
+            await asyncio.sleep(delay + random.uniform(0, 0.2))
+
+
 def _parse_counts(val):
     if not val:
         return 0
@@ -74,28 +107,59 @@ class TwitterScraper(BaseScraper):
         super().__init__()
         self.client = Client("en-US")
         self._load_cookies()
+        # 目标语言整次采集不变, 不在每条推文里重查配置
+        self._target_lang = load_key("target_language") or "简体中文"
+        # 限速器绑定事件循环, 在 _fetch_async 内创建 (与 Semaphore 同理)
+        self._limiter = None
+
+    @staticmethod
+    def _has_video(tweet) -> bool:
+        """快速判断推文自身是否带视频 (不追转发/引用, 只做粗筛)"""
+        media = _get_val(tweet, "media")
+        if not media:
+            return False
+        return any(
+            _get_val(m, "type") in ("video", "animated_gif") for m in media
+        )
+
+    async def _get_tweets_with_retry(self, user, tab, count, retries=3):
+        """限速 + 指数退避抖动重试的 get_tweets 封装"""
+        for attempt in range(retries):
+            await self._limiter.wait()
+            try:
+                return await user.get_tweets(tab, count=count)
+            except Exception:
+                if attempt == retries - 1:
+                    return None
+                await asyncio.sleep(0.5 * (2 ** attempt) + random.uniform(0, 0.5))
+        return None
 
     def _load_cookies(self):
         """加载 Twitter Cookie（兼容 Playwright 格式和 twikit 格式）"""
+        # 预转换缓存比原始文件新时直接加载, 跳过下方的格式转换分支
+        if (
+            TWIKIT_COOKIES_PATH.exists()
+            and (not COOKIES_PATH.exists()
+                 or TWIKIT_COOKIES_PATH.stat().st_mtime >= COOKIES_PATH.stat().st_mtime)
+        ):
+            try:
+                self.client.load_cookies(str(TWIKIT_COOKIES_PATH))
+                return
+            except Exception:
+                pass
+
         if not COOKIES_PATH.exists():
             raise FileNotFoundError(f"找不到 Cookie 文件: {COOKIES_PATH}")
 
         try:
             self.client.load_cookies(str(COOKIES_PATH))
         except Exception:
-            # Playwright 格式转 twikit 格式
-            with open(COOKIES_PATH, "r", encoding="utf-8") as f:
-                playwright_cookies = json.load(f)
+            # Playwright 格式转 twikit 格式, 转换结果落盘缓存,
+            # 下次运行凭 mtime 判新直接复用, 不再重复解析/写临时文件
+            playwright_cookies = orjson.loads(COOKIES_PATH.read_bytes())
             twikit_cookies = {c["name"]: c["value"] for c in playwright_cookies}
-            temp_path = str(COOKIES_PATH) + ".temp.json"
-            with open(temp_path, "w", encoding="utf-8") as f:
-                json.dump(twikit_cookies, f)
-            try:
-                self.client.load_cookies(temp_path)
-            finally:
-                # 无论成功或异常，均确保临时文件被删除
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+            TWIKIT_COOKIES_PATH.write_bytes(orjson.dumps(twikit_cookies))
+            self.client.load_cookies(str(TWIKIT_COOKIES_PATH))
 
     async def _fetch_account(self, screen_name: str, count: int = 20) -> List[Dict]:
         """抓取单个账号的视频"""
@@ -103,33 +167,37 @@ class TwitterScraper(BaseScraper):
         try:
             from shared.logger import console
             console.print(f"    [dim]🔍 正在抓取 X 用户: @{screen_name}...[/dim]")
-            await asyncio.sleep(random.uniform(1, 2))
+            await self._limiter.wait()
             user = await self.client.get_user_by_screen_name(screen_name)
 
-            # 混合抓取 Tweets + Media
+            # 混合抓取 Tweets + Media; Tweets 标签页已凑够 count 条
+            # 带视频的推文时跳过 Media, 省一次 API 调用和限速排队
             all_tweets = []
-            for tab in ["Tweets", "Media"]:
-                try:
-                    # console.print(f"      [dim]抓取 {tab} 标签页...[/dim]")
-                    ts = await user.get_tweets(tab, count=count)
-                    if ts:
-                        all_tweets.extend(ts)
-                    await asyncio.sleep(1)
-                except Exception:
-                    pass
+            ts = await self._get_tweets_with_retry(user, "Tweets", count)
+            if ts:
+                all_tweets.extend(ts)
+            video_hits = sum(1 for t in all_tweets if self._has_video(t))
+            if video_hits < count:
+                ts = await self._get_tweets_with_retry(user, "Media", count)
+                if ts:
+                    all_tweets.extend(ts)
             
             # console.print(f"      [dim]获取到 {len(all_tweets)} 条推文，正在去重...[/dim]")
 
-            # 去重排序
-            unique = sorted(
-                {t.id: t for t in all_tweets}.values(),
-                key=lambda x: _get_val(x, "created_at", ""),
-                reverse=True,
-            )
-            
+            # 单遍去重 + 预计算排序键 (省去临时 dict 和排序时的重复 _get_val)
+            seen = set()
+            unique = []
+            for t in all_tweets:
+                tid = t.id
+                if tid in seen:
+                    continue
+                seen.add(tid)
+                unique.append((_get_val(t, "created_at", ""), t))
+            unique.sort(key=lambda p: p[0], reverse=True)
+
             # console.print(f"      [dim]去重后剩余 {len(unique)} 条，开始解析视频...[/dim]")
 
-            for tweet in unique:
+            for _, tweet in unique:
                 created_at = _get_val(tweet, "created_at", "unknown")
                 is_retweet = hasattr(tweet, "retweeted_tweet") and tweet.retweeted_tweet
                 is_quote = hasattr(tweet, "quoted_tweet") and tweet.quoted_tweet
@@ -143,7 +211,9 @@ class TwitterScraper(BaseScraper):
                     target_tweet = tweet.quoted_tweet
                     source_type = "引用"
 
-                media = _get_val(target_tweet, "media")
+                # 同一对象的热字段访问共用一个已定型的取值函数
+                tget = _make_getter(target_tweet)
+                media = tget(target_tweet, "media")
                 if not media:
                     continue
 
@@ -154,20 +224,24 @@ class TwitterScraper(BaseScraper):
                     if m_type in ["video", "animated_gif"]:
                         v_info = _get_val(media_item, "video_info") or media_item
                         variants = _get_val(v_info, "variants", [])
-                        # 过滤掉 bitrate=0 的 HTTP 流变体（m3u8 等），只保留直链 MP4
-                        valid = [
-                            {"url": _get_val(v, "url"), "bitrate": _get_val(v, "bitrate", 0)}
-                            for v in variants
-                            if _get_val(v, "url") and _get_val(v, "bitrate", 0) > 0
-                        ]
-                        # 若过滤后为空（全为 HTTP 流），降级使用任何可用 URL
-                        if not valid:
-                            valid = [
-                                {"url": _get_val(v, "url"), "bitrate": 0}
-                                for v in variants if _get_val(v, "url")
-                            ]
-                        if valid:
-                            video_url = max(valid, key=lambda x: x["bitrate"])["url"]
+                        # 单遍流式取最高 bitrate 的直链 MP4 (跳过 bitrate=0 的
+                        # m3u8 等 HTTP 流), 全为流时降级用第一个可用 URL;
+                        # 不再构造中间 dict 列表再 max
+                        best_url = None
+                        best_br = 0
+                        first_url = None
+                        for v in variants:
+                            u = _get_val(v, "url")
+                            if not u:
+                                continue
+                            if first_url is None:
+                                first_url = u
+                            br = _get_val(v, "bitrate", 0) or 0
+                            if br > best_br:
+                                best_br = br
+                                best_url = u
+                        video_url = best_url or first_url
+                        if video_url:
                             break
 
                 if not video_url or not self.is_new(video_url):
@@ -184,7 +258,7 @@ class TwitterScraper(BaseScraper):
                     if duration_ms_alt:
                         duration_sec = duration_ms_alt / 1000
                     else:
-                        duration_sec = _get_val(target_tweet, "duration", 0)
+                        duration_sec = tget(target_tweet, "duration", 0)
 
                 # 如果仍然获取不到时长，让其保持为 0，以便 workflow_1_pre.py 调用 yt-dlp 补全
                 # 但需要注意的是，直接使用 video_url (mp4直链) 可能无法通过 yt-dlp 获取时长
@@ -194,7 +268,7 @@ class TwitterScraper(BaseScraper):
                 tweet_url = f"https://x.com/{screen_name}/status/{target_tweet.id}"
                 
                 # 内容预筛选
-                title_text = _get_val(target_tweet, "text", "").replace("\n", " ")
+                title_text = clean_text(tget(target_tweet, "text", ""))
                 if not self.validate_content(title_text):
                     continue
 
@@ -202,14 +276,14 @@ class TwitterScraper(BaseScraper):
                     title=title_text[:100],
                     rawtext=title_text,
                     duration=duration_sec,
-                    viewCount=_parse_counts(_get_val(target_tweet, "view_count", 0)),
-                    Reposts=_parse_counts(_get_val(target_tweet, "retweet_count", 0)),
+                    viewCount=_parse_counts(tget(target_tweet, "view_count", 0)),
+                    Reposts=_parse_counts(tget(target_tweet, "retweet_count", 0)),
                     channel_name=f"X_{screen_name}",
                     **{
                         "Video File": video_url, # 这里仍然保存 MP4 直链供下载使用
                         "Original URL": tweet_url, # 保存原始链接用于元数据补全
                         "Publish Date": str(created_at),
-                        "Target Language": load_key("target_language") or "简体中文",
+                        "Target Language": self._target_lang,
                     },
                 )
                 entry["source_type"] = source_type
@@ -232,14 +306,28 @@ class TwitterScraper(BaseScraper):
         accounts = _get_accounts()
         if not accounts:
             return []
-        all_videos = []
+        self._limiter = _LeakyBucket(rate=1.0, capacity=4)
+        # 账号级并发: 信号量封顶, 限速等待互相重叠而不是串行叠加
+        sema = asyncio.Semaphore(load_key("twitter_scrapers.concurrent_limit") or 3)
+
         with create_progress() as progress:
             task = progress.add_task("[cyan]采集 X 数据...", total=len(accounts))
-            for screen_name in accounts:
-                progress.update(task, description=f"🔍 处理 X: @{screen_name}")
-                videos = await self._fetch_account(screen_name, count=20)
-                all_videos.extend(videos)
+
+            async def fetch_one(screen_name):
+                async with sema:
+                    videos = await self._fetch_account(screen_name, count=20)
+                progress.update(task, description=f"🔍 完成 X: @{screen_name}")
                 progress.advance(task)
+                return videos
+
+            results = await asyncio.gather(
+                *[fetch_one(a) for a in accounts], return_exceptions=True
+            )
+
+        all_videos = []
+        for r in results:
+            if isinstance(r, list):
+                all_videos.extend(r)
         return all_videos
 
     def fetch(self) -> List[Dict]:
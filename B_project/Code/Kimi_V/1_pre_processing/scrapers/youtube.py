@@ -13,19 +13,19 @@ YouTube 视频采集器。
 
 import asyncio
 import aiohttp
-import re
-import sys
+import itertools
+import orjson
 import platform
-from pathlib import Path
+import re
 from typing import List, Dict, Optional
 
-PROJECT_ROOT = Path(__file__).parent.parent.parent.absolute()
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from _bootstrap import PROJECT_ROOT  # noqa: F401  确保项目根目录在 sys.path 中
 
 from core.utils.config_utils import load_key
 from shared.domain import domain
-from _base_scraper import BaseScraper
+from shared.paths import PRE_PROCESSING
+from _base_scraper import BaseScraper, clean_text, make_connector
+from _http_cache import HttpCache
 
 
 class YouTubeScraper(BaseScraper):
@@ -42,24 +42,43 @@ class YouTubeScraper(BaseScraper):
         self.channels = yt_config.get("channels", {})
         self.fetch_limit = yt_config.get("fetch_limit", 5)
         self.filters = yt_config.get("filters", {})
+        # 领域黑名单预编译成单个不区分大小写的正则:
+        # 每个标题一次 C 级扫描, 代替逐词 substring + 重复 upper()
+        keywords = self.filters.get("blacklist_keywords", [])
+        self._keyword_re = (
+            re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+            if keywords else None
+        )
 
         self.base_url = "https://www.googleapis.com/youtube/v3"
         # Semaphore 在 __init__ 中创建，所有请求共享同一个限速器
         self._semaphore: Optional[asyncio.Semaphore] = None
+        # 条件请求缓存: 没更新的频道命中 304, 复用上次解析结果
+        self._http_cache = HttpCache(PRE_PROCESSING / "scrapers" / ".youtube_http_cache.json")
 
     # ---------- API ----------
 
     async def _request(self, session, url, params=None) -> Optional[dict]:
         if self._semaphore is None:
             self._semaphore = asyncio.Semaphore(self.concurrent_limit)
+        cache_key = HttpCache.key(url, params)
         async with self._semaphore:
             try:
-                async with session.get(url, params=params) as resp:
-                    return await resp.json() if resp.status == 200 else None
+                headers = self._http_cache.conditional_headers(cache_key)
+                async with session.get(url, params=params, headers=headers) as resp:
+                    if resp.status == 304:
+                        return self._http_cache.cached_payload(cache_key)
+                    if resp.status != 200:
+                        return None
+                    # 读原始 bytes 交给 orjson, 避开 stdlib json 的逐字符解析
+                    data = orjson.loads(await resp.read())
+                    self._http_cache.store(cache_key, resp.headers, data)
+                    return data
             except Exception:
                 return None
 
-    async def _get_channel_videos(self, session, channel_id, channel_name) -> List[Dict]:
+    async def _search_channel(self, session, channel_id, channel_name) -> List[tuple]:
+        """第一阶段: 每频道一次 /search, 返回 (videoId, channel_name) 对"""
         search_params = {
             "part": "snippet", "channelId": channel_id, "order": "date",
             "maxResults": self.fetch_limit + 5, "type": "video", "key": self.api_key,
@@ -67,23 +86,18 @@ class YouTubeScraper(BaseScraper):
         search_data = await self._request(session, f"{self.base_url}/search", search_params)
         if not search_data or "items" not in search_data:
             return []
+        return [(item["id"]["videoId"], channel_name) for item in search_data["items"]]
 
-        video_ids = [item["id"]["videoId"] for item in search_data["items"]]
-        detail_params = {
-            "part": "snippet,contentDetails,statistics",
-            "id": ",".join(video_ids), "key": self.api_key,
-        }
-        detail_data = await self._request(session, f"{self.base_url}/videos", detail_params)
-
+    def _collect_channel_videos(self, items, channel_name) -> List[Dict]:
+        """按频道过滤/截断已拿到的详情条目"""
+        items.sort(key=lambda x: x["snippet"]["publishedAt"], reverse=True)
         results = []
-        if detail_data and "items" in detail_data:
-            items = sorted(detail_data["items"], key=lambda x: x["snippet"]["publishedAt"], reverse=True)
-            for item in items:
-                if len(results) >= self.fetch_limit:
-                    break
-                entry = self._parse(item, channel_name)
-                if entry and self.is_new(entry["Video File"]):
-                    results.append(entry)
+        for item in items:
+            if len(results) >= self.fetch_limit:
+                break
+            entry = self._parse(item, channel_name)
+            if entry and self.is_new(entry["Video File"]):
+                results.append(entry)
 
         if results:
             print(f"    {channel_name}: 采集到 {len(results)} 个新视频")
@@ -94,11 +108,10 @@ class YouTubeScraper(BaseScraper):
 
     def _parse(self, item, channel_name) -> Optional[Dict]:
         try:
-            title = item["snippet"]["title"]
+            title = clean_text(item["snippet"]["title"])
 
             # 关键词黑名单过滤
-            blacklist = self.filters.get("blacklist_keywords", [])
-            if any(w.upper() in title.upper() for w in blacklist):
+            if self._keyword_re is not None and self._keyword_re.search(title):
                 return None
 
             # 时长过滤
@@ -114,7 +127,7 @@ class YouTubeScraper(BaseScraper):
             return self.make_entry(
                 Score=0,
                 title=title,
-                rawtext=item["snippet"].get("description", "")[:500].replace("\n", " "),
+                rawtext=clean_text(item["snippet"].get("description", "")[:500]),
                 duration=duration,
                 viewCount=int(stats.get("viewCount", 0)),
                 Replies=int(stats.get("commentCount", 0)),
@@ -126,26 +139,97 @@ class YouTubeScraper(BaseScraper):
 
     @staticmethod
     def _parse_duration(dur_str: str) -> int:
-        match = re.match(r"PT(\d+H)?(\d+M)?(\d+S)?", dur_str)
-        if not match:
-            return 0
-        h = int(match.group(1)[:-1]) if match.group(1) else 0
-        m = int(match.group(2)[:-1]) if match.group(2) else 0
-        s = int(match.group(3)[:-1]) if match.group(3) else 0
-        return h * 3600 + m * 60 + s
+        # 单遍字符扫描代替正则: 纯整数算术, 无 match 对象分配
+        total = 0
+        n = 0
+        for c in dur_str:
+            if "0" <= c <= "9":
+                n = n * 10 + (ord(c) - 48)
+            elif c == "H":
+                total += n * 3600
+                n = 0
+            elif c == "M":
+                total += n * 60
+                n = 0
+            elif c == "S":
+                total += n
+                n = 0
+            elif c == "D":
+                total += n * 86400
+                n = 0
+            else:
+                n = 0
+        return total
 
     # ---------- 异步主逻辑 ----------
 
-    async def _fetch_async(self) -> List[Dict]:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
-            tasks = [
-                self._get_channel_videos(session, cid, name)
+    async def _fetch_async(self, out_queue: Optional[asyncio.Queue] = None) -> List[Dict]:
+        """抓取全部频道。
+
+        传入 out_queue 时, 每个频道过滤完成即把该频道的条目列表放入
+        队列 (结束时放入 None 哨兵), 下游可以边消费边处理;
+        不传时行为不变, 返回汇总列表。
+        """
+        # 显式连接池: DNS 缓存 + keepalive 让 /search 与 /videos
+        # 复用同一条 TLS 连接, 小响应下握手开销占大头
+        connector = make_connector(self.concurrent_limit)
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=30)
+        ) as session:
+            # 第一阶段: 所有频道并发 /search, 单个频道异常不拖垮整批
+            searches = await asyncio.gather(*[
+                self._search_channel(session, cid, name)
                 for name, cid in self.channels.items()
-            ]
-            all_videos = []
-            for coro in asyncio.as_completed(tasks):
-                all_videos.extend(await coro)
-            return all_videos
+            ], return_exceptions=True)
+
+            # videoId -> channel_name 映射, 用于把批量详情结果分流回频道
+            id_to_channel: Dict[str, str] = {}
+            for pairs in searches:
+                if not isinstance(pairs, list):
+                    continue
+                for vid, name in pairs:
+                    id_to_channel.setdefault(vid, name)
+
+            # 第二阶段: 全部 videoId 按 50 个一组批量请求 /videos
+            # (API 上限 50 id/次), N 个频道只需 ceil(total/50) 次详情调用
+            ids = list(id_to_channel)
+            detail_tasks = []
+            for i in range(0, len(ids), 50):
+                params = {
+                    "part": "snippet,contentDetails,statistics",
+                    "id": ",".join(ids[i:i + 50]), "key": self.api_key,
+                }
+                detail_tasks.append(self._request(session, f"{self.base_url}/videos", params))
+
+            # 分块一返回就分流, 让 CPU 侧处理与剩余分块的下载重叠
+            by_channel: Dict[str, list] = {}
+            for fut in asyncio.as_completed(detail_tasks):
+                data = await fut
+                if data and "items" in data:
+                    for item in data["items"]:
+                        name = id_to_channel.get(item["id"])
+                        if name is not None:
+                            by_channel.setdefault(name, []).append(item)
+
+            per_channel = (
+                self._collect_channel_videos(by_channel.get(channel_name, []), channel_name)
+                for channel_name in self.channels
+            )
+            if out_queue is None:
+                # 一次性展平, 避免循环内反复 extend 触发 list 扩容
+                all_videos = list(itertools.chain.from_iterable(per_channel))
+            else:
+                all_videos = []
+                for results in per_channel:
+                    await out_queue.put(results)
+                    all_videos.extend(results)
+                await out_queue.put(None)
+
+        try:
+            self._http_cache.save()
+        except Exception:
+            pass
+        return all_videos
 
     # ---------- 标准接口 ----------
 
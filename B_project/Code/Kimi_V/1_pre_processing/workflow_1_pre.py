@@ -31,7 +31,7 @@ sys.path.append(str(PROJECT_ROOT / "2_mid_processing"))
 sys.path.append(str(Path(__file__).parent / "scrapers"))
 
 from shared.paths import TASKS_EXCEL, VISITED_LOG
-from shared.state import load_visited, save_visited
+from shared.state import append_visited
 from shared.logger import console, create_progress, Panel, Table
 from core.utils.config_utils import load_key
 from core.utils.ask_gpt import ask_gpt
@@ -201,15 +201,15 @@ def pre_process_workflow():
         )
     )
 
-    visited = load_visited()
-
     # 获取现有 Excel 中的 URL（用于增量对比）
     existing_urls = set()
     if TASKS_EXCEL.exists():
         try:
-            df_old = pd.read_excel(TASKS_EXCEL)
-            if "Video File" in df_old.columns:
-                existing_urls = set(df_old["Video File"].dropna().astype(str).tolist())
+            # 只解析 Video File 一列, 省掉 openpyxl 对其余列的 XML 解析
+            df_old = pd.read_excel(
+                TASKS_EXCEL, usecols=["Video File"], dtype={"Video File": str}
+            )
+            existing_urls = set(df_old["Video File"].dropna().tolist())
         except Exception as e:
             console.print(f"[yellow]⚠️ 读取现有 Excel 失败，全量更新: {e}[/yellow]")
 
@@ -302,10 +302,8 @@ def pre_process_workflow():
     TASKS_EXCEL.parent.mkdir(parents=True, exist_ok=True)
     final_df.to_excel(TASKS_EXCEL, index=False)
 
-    # 更新访问记录
-    for v in all_fetched:
-        visited.add(v["Video File"])
-    save_visited(visited)
+    # 更新访问记录 (只追加新增, 不重写全量)
+    append_visited(v["Video File"] for v in all_fetched)
 
     # ==================== 5. 汇总输出 ====================
 
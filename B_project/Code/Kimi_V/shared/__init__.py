@@ -7,11 +7,11 @@ shared/__init__.py
     from shared import PROJECT_ROOT, console, domain, aesthetics
     from shared.domain import domain
     from shared.aesthetics import aesthetics
-    from shared.state import load_visited, save_visited
+    from shared.state import load_visited, append_visited
 """
 
 from shared.paths import *
 from shared.logger import console
-from shared.state import load_visited, save_visited
+from shared.state import load_visited, save_visited, append_visited
 from shared.domain import domain, get_domain
 from shared.aesthetics import aesthetics, get_aesthetics
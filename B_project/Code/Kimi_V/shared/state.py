@@ -11,29 +11,76 @@ shared/state.py
 """
 
 import json
+
+import orjson
+
 from pathlib import Path
 from shared.paths import VISITED_LOG, PUBLISH_HISTORY
 
 
 # ==================== 已访问视频去重 ====================
 
+# 访问记录只增不减: 新增 URL 以 JSON Lines 追加写入 .jsonl 文件
+# (O(新增) 而非每次重写整个集合 O(N)); 旧的 visited_videos.json
+# 仍会被读取, 历史数据无需迁移。
+VISITED_JSONL = VISITED_LOG.with_suffix(".jsonl")
+
+# 进程内缓存: 三个采集器初始化时各自 load_visited(), 同一份记录
+# 不必解析三遍、也不必各持一份 N 个字符串的副本。
+# 返回的是共享集合, 调用方只做成员判断, 不要原地修改。
+_visited_cache: set = None
+_visited_stamp: tuple = None
+
+
+def _stamp() -> tuple:
+    """缓存失效键: 两个记录文件的 (mtime, size)"""
+    legacy = VISITED_LOG.stat().st_mtime if VISITED_LOG.exists() else None
+    jsonl = VISITED_JSONL.stat().st_size if VISITED_JSONL.exists() else None
+    return (legacy, jsonl)
+
+
 def load_visited() -> set:
-    """加载已访问视频 URL 集合"""
+    """加载已访问视频 URL 集合（进程内缓存）"""
+    global _visited_cache, _visited_stamp
+    stamp = _stamp()
+    if _visited_cache is not None and _visited_stamp == stamp:
+        return _visited_cache
+    visited = set()
     if VISITED_LOG.exists():
         try:
-            return set(json.loads(VISITED_LOG.read_text(encoding="utf-8")))
+            # 大集合下 orjson 解析明显快于 stdlib json
+            visited.update(orjson.loads(VISITED_LOG.read_bytes()))
+        except Exception:
+            pass
+    if VISITED_JSONL.exists():
+        try:
+            with open(VISITED_JSONL, "rb") as f:
+                visited.update(orjson.loads(line) for line in f if line.strip())
         except Exception:
-            return set()
-    return set()
+            pass
+    _visited_cache, _visited_stamp = visited, stamp
+    return visited
+
+
+def append_visited(urls):
+    """把新出现的 URL 追加进访问记录（支持单个或可迭代）"""
+    global _visited_stamp
+    visited = load_visited()
+    if isinstance(urls, str):
+        urls = [urls]
+    new = [u for u in urls if u not in visited]
+    if not new:
+        return
+    VISITED_JSONL.parent.mkdir(parents=True, exist_ok=True)
+    with open(VISITED_JSONL, "ab") as f:
+        f.write(b"".join(orjson.dumps(u) + b"\n" for u in new))
+    visited.update(new)
+    _visited_stamp = _stamp()
 
 
 def save_visited(visited: set):
-    """保存已访问视频 URL 集合"""
-    VISITED_LOG.parent.mkdir(parents=True, exist_ok=True)
-    VISITED_LOG.write_text(
-        json.dumps(list(visited), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    """保存已访问视频 URL 集合（只追加新增部分, 记录从不删除）"""
+    append_visited(visited)
 
 
 def is_visited(url: str) -> bool:
@@ -43,12 +90,7 @@ def is_visited(url: str) -> bool:
 
 def mark_visited(urls):
     """标记 URL 为已访问（支持单个或列表）"""
-    visited = load_visited()
-    if isinstance(urls, str):
-        visited.add(urls)
-    else:
-        visited.update(urls)
-    save_visited(visited)
+    append_visited(urls)
 
 
 # ==================== 发布历史 ====================